@@ -1,7 +1,8 @@
 # mycelium package
 """Multi-agent workflow framework for AI-assisted development."""
 
-from mycelium.llm import complete
+from typing import Any
+
 from mycelium.models import (
     ErrorObject,
     OutputEnvelope,
@@ -19,3 +20,13 @@ __all__ = [
     "error_envelope",
     "make_envelope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve `mycelium.complete` on first access so importing the package
+    # (e.g. for `mycelium --help`) doesn't pull in the LLM client module.
+    if name == "complete":
+        from mycelium.llm import complete
+
+        return complete
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,16 +9,33 @@ Spec reference: §6.3 PIPE-002
 from __future__ import annotations
 
 import os
+import stat
 import tempfile
 from pathlib import Path
 
 
+def _new_file_mode() -> int:
+    """Return the mode open() would give a new file under the current umask."""
+    try:
+        # Linux exposes the umask without having to change it.
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 def atomic_write_text(
     path: Path,
     content: str,
     *,
     encoding: str = "utf-8",
     mkdir: bool = True,
+    preserve_mode: bool = False,
 ) -> None:
     """Write content to a file atomically using temp file + rename.
 
@@ -31,6 +48,9 @@ def atomic_write_text(
         content: Text content to write.
         encoding: Text encoding (default utf-8).
         mkdir: If True, create parent directories as needed.
+        preserve_mode: If True, give the new file the target's permission
+            bits, or the umask-derived default if the target doesn't exist,
+            instead of mkstemp's 0600.
 
     Raises:
         OSError: If the write or rename fails.
@@ -38,6 +58,13 @@ def atomic_write_text(
     if mkdir:
         path.parent.mkdir(parents=True, exist_ok=True)
 
+    mode = None
+    if preserve_mode:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _new_file_mode()
+
     fd, tmp_path = tempfile.mkstemp(
         dir=str(path.parent),
         prefix=f".{path.name}.",
@@ -45,6 +72,8 @@ def atomic_write_text(
     )
     try:
         with os.fdopen(fd, "w", encoding=encoding) as f:
+            if mode is not None:
+                os.chmod(tmp_path, mode)
             f.write(content)
             f.flush()
             os.fsync(f.fileno())
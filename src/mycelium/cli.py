@@ -14,7 +14,9 @@ import argparse
 import logging
 import os
 import sys
+import textwrap
 from pathlib import Path
+from typing import Callable
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +27,11 @@ logger = logging.getLogger(__name__)
 
 _AUTO_APPROVE_TRUE_VALUES = {"1", "true", "yes"}
 
+# Banner rules shared by the run/status/auto output.
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+_SEP50 = "─" * 50
+
 
 def _normalize_objective(progress: dict) -> str:
     """Extract a printable objective string from possibly malformed progress payloads."""
@@ -129,12 +136,7 @@ def cmd_run(args: argparse.Namespace) -> int:
         print(f"❌ Error: {response.error}", file=sys.stderr)
         return 1
     
-    print("=" * 60)
-    print("AGENT OUTPUT")
-    print("=" * 60)
-    print(response.content)
-    print("=" * 60)
-    print()
+    sys.stdout.write(f"{_BAR60}\nAGENT OUTPUT\n{_BAR60}\n{response.content}\n{_BAR60}\n\n")
     
     if response.usage.total_tokens > 0:
         print(f"📊 Tokens: {response.usage.total_tokens:,} "
@@ -149,7 +151,7 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Execute the status command with LLM usage."""
-    from mycelium.orchestrator import get_usage_summary, load_progress, normalize_current_agent
+    from mycelium.orchestrator import load_progress, normalize_current_agent, summarize_usage
     
     mission_path = Path(args.mission_path)
     
@@ -171,66 +173,64 @@ def cmd_status(args: argparse.Namespace) -> int:
     current_agent = normalize_current_agent(progress.get("current_agent", ""))
     objective = _normalize_objective(progress)
     
-    print()
-    print(f"📋 Mission: {mission_name}")
-    print("─" * 50)
+    # Build the whole report and emit it with a single write.
+    out = ["", f"📋 Mission: {mission_name}", _SEP50]
     
     if not current_agent:
-        print("Agent:      ✅ (complete)")
+        out.append("Agent:      ✅ (complete)")
     else:
-        print(f"Agent:      🔵 {current_agent}")
+        out.append(f"Agent:      🔵 {current_agent}")
     
     if objective:
-        print()
-        print("Objective:")
+        out.append("")
+        out.append("Objective:")
         # Wrap long objectives
-        if len(objective) > 70:
-            words = objective.split()
-            line = "  "
-            for word in words:
-                if len(line) + len(word) + 1 > 70:
-                    print(line)
-                    line = "  " + word
-                else:
-                    line += " " + word if line != "  " else word
-            if line.strip():
-                print(line)
-        else:
-            print(f"  {objective}")
+        wrapped = textwrap.wrap(
+            objective,
+            width=70,
+            initial_indent="  ",
+            subsequent_indent="  ",
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
+        out.extend(wrapped or [f"  {objective}"])
     
-    # LLM usage summary
-    usage = get_usage_summary(mission_path)
+    # LLM usage summary, from the progress already loaded above
+    usage = summarize_usage(progress)
     
     if usage["runs"] > 0:
-        print()
-        print("📊 LLM Usage:")
-        print(f"  Runs:        {usage['runs']}")
-        print(f"  Total tokens: {usage['total_tokens']:,}")
-        print(f"  Total cost:   ${usage['total_cost_usd']:.6f}")
+        out.append("")
+        out.append("📊 LLM Usage:")
+        out.append(f"  Runs:        {usage['runs']}")
+        out.append(f"  Total tokens: {usage['total_tokens']:,}")
+        out.append(f"  Total cost:   ${usage['total_cost_usd']:.6f}")
         
         if args.verbose and usage.get("runs_detail"):
-            print()
-            print("  Run Details:")
+            out.append("")
+            out.append("  Run Details:")
             for i, run in enumerate(usage["runs_detail"], 1):
-                print(f"    {i}. {run.get('agent_role', 'unknown')} - "
-                      f"{run.get('total_tokens', 0):,} tokens - "
-                      f"${run.get('cost_usd', 0):.6f}")
+                out.append(f"    {i}. {run.get('agent_role', 'unknown')} - "
+                           f"{run.get('total_tokens', 0):,} tokens - "
+                           f"${run.get('cost_usd', 0):.6f}")
     else:
-        print()
-        print("📊 LLM Usage: (no runs yet)")
+        out.append("")
+        out.append("📊 LLM Usage: (no runs yet)")
     
-    print()
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
 def cmd_auto(args: argparse.Namespace) -> int:
     """Execute auto-loop command - runs agents until mission complete or circuit breaker trips."""
     from mycelium.orchestrator import (
-        get_usage_summary,
-        load_progress,
+        load_progress_with_text,
         normalize_current_agent,
+        resolve_progress_file,
         run_agent,
+        summarize_usage,
     )
+    from mycelium.progress_cache import invalidate_progress
     
     mission_path = Path(args.mission_path)
     
@@ -241,12 +241,14 @@ def cmd_auto(args: argparse.Namespace) -> int:
     # Configuration from args/env
     max_iterations, max_cost, max_failures, auto_approve = _resolve_auto_config(args)
     
-    print(f"🔄 Auto mode for mission: {mission_path}")
-    print(f"   Max iterations: {max_iterations}")
-    print(f"   Max cost: ${max_cost:.2f}")
-    print(f"   Max failures: {max_failures}")
-    print(f"   Auto-approve: {auto_approve}")
-    print()
+    sys.stdout.write(
+        f"🔄 Auto mode for mission: {mission_path}\n"
+        f"   Max iterations: {max_iterations}\n"
+        f"   Max cost: ${max_cost:.2f}\n"
+        f"   Max failures: {max_failures}\n"
+        f"   Auto-approve: {auto_approve}\n"
+        "\n"
+    )
     
     # Loop state
     iteration = 0
@@ -254,10 +256,30 @@ def cmd_auto(args: argparse.Namespace) -> int:
     cumulative_cost = 0.0
     exit_reason = "complete"
 
+    # Resolve progress.yaml once; each iteration only re-parses it when it
+    # changed (e.g. skipped agents leave it untouched). An unchanged
+    # (mtime, size) stamp is confirmed against the last text, since a
+    # same-size rewrite within one tick of a coarse clock keeps the stamp.
+    progress_file = resolve_progress_file(mission_path)
+    progress: dict = {}
+    last_stamp: tuple[int, int] | None = None
+    last_text: str | None = None
+
     while True:
         # Load current progress
         try:
-            progress = load_progress(mission_path)
+            stat = progress_file.stat()
+            stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None  # let load_progress_with_text report the problem
+        try:
+            if stamp is None or stamp != last_stamp:
+                progress, last_text = load_progress_with_text(progress_file)
+                last_stamp = stamp
+            elif progress_file.read_text() != last_text:
+                # The stat-validated progress cache can't see this edit either.
+                invalidate_progress(progress_file)
+                progress, last_text = load_progress_with_text(progress_file)
         except Exception as e:
             print(f"❌ Error loading progress: {e}", file=sys.stderr)
             return 1
@@ -307,10 +329,12 @@ def cmd_auto(args: argparse.Namespace) -> int:
                 continue
         
         # Run agent
-        print("\n" + "=" * 50)
-        print(f"🔄 SWITCHING AGENT: {current_agent.upper()}")
-        print("=" * 50)
-        print(f"🚀 Running {current_agent} agent (iteration {iteration + 1}/{max_iterations})")
+        sys.stdout.write(
+            f"\n{_BAR50}\n"
+            f"🔄 SWITCHING AGENT: {current_agent.upper()}\n"
+            f"{_BAR50}\n"
+            f"🚀 Running {current_agent} agent (iteration {iteration + 1}/{max_iterations})\n"
+        )
         
         response = run_agent(
             mission_path=mission_path,
@@ -326,26 +350,34 @@ def cmd_auto(args: argparse.Namespace) -> int:
             consecutive_failures = 0
             cumulative_cost += response.usage.cost_usd
             
-            print(f"   ✓ Tokens: {response.usage.total_tokens:,}")
-            print(f"   ✓ Cost: ${response.usage.cost_usd:.6f} (cumulative: ${cumulative_cost:.4f})")
+            out = [
+                f"   ✓ Tokens: {response.usage.total_tokens:,}",
+                f"   ✓ Cost: ${response.usage.cost_usd:.6f} (cumulative: ${cumulative_cost:.4f})",
+            ]
             
             if args.verbose:
-                print(f"\n--- Output ---")
-                print(response.content[:500] + "..." if len(response.content) > 500 else response.content)
-                print(f"--- End ---\n")
+                out.append("\n--- Output ---")
+                out.append(
+                    response.content[:500] + "..."
+                    if len(response.content) > 500
+                    else response.content
+                )
+                out.append("--- End ---\n")
+            sys.stdout.write("\n".join(out) + "\n")
         else:
             consecutive_failures += 1
             print(f"   ✗ Failed: {response.error}")
     
     # Summary
-    print()
-    print("=" * 50)
-    print(f"📊 Auto mode complete after {iteration} iteration(s)")
+    out = ["", _BAR50, f"📊 Auto mode complete after {iteration} iteration(s)"]
     
-    usage = get_usage_summary(mission_path)
+    # Every exit from the loop above follows a fresh load of progress.yaml, so
+    # the in-memory copy already reflects the last saved run.
+    usage = summarize_usage(progress)
     if usage["runs"] > 0:
-        print(f"   Total tokens: {usage['total_tokens']:,}")
-        print(f"   Total cost: ${usage['total_cost_usd']:.6f}")
+        out.append(f"   Total tokens: {usage['total_tokens']:,}")
+        out.append(f"   Total cost: ${usage['total_cost_usd']:.6f}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     return 0 if exit_reason == "complete" else 2
 
@@ -449,21 +481,11 @@ def cmd_context(args: argparse.Namespace) -> int:
     return _print_envelope(execute_context(raw_input))
 
 
-def main() -> int:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        prog="mycelium-py",
-        description="Mycelium CLI - AI agent orchestration via LiteLLM",
-    )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose output",
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # run command
+# ─── Argument parsing ─────────────────────────────────────────────────────
+
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the run command."""
     run_parser = subparsers.add_parser(
         "run",
         help="Run the current agent for a mission via LiteLLM",
@@ -487,8 +509,10 @@ def main() -> int:
         help="Build prompt but don't call LLM",
     )
     run_parser.set_defaults(func=cmd_run)
-    
-    # status command  
+
+
+def _add_status_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the status command."""
     status_parser = subparsers.add_parser(
         "status",
         help="Show mission status with LLM usage",
@@ -503,8 +527,10 @@ def main() -> int:
         help="Show detailed usage breakdown",
     )
     status_parser.set_defaults(func=cmd_status)
-    
-    # auto command
+
+
+def _add_auto_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the auto command."""
     auto_parser = subparsers.add_parser(
         "auto",
         help="Run agents in a loop until mission complete or circuit breaker trips",
@@ -549,9 +575,11 @@ def main() -> int:
     )
     auto_parser.set_defaults(func=cmd_auto)
 
-    # ── Knowledge Vault commands ──────────────────────────────────────────
 
-    # ingest
+# ── Knowledge Vault commands ──────────────────────────────────────────
+
+def _add_ingest_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ingest command."""
     ingest_parser = subparsers.add_parser(
         "ingest",
         help="Ingest a URL, PDF, or text bundle into the knowledge vault",
@@ -565,7 +593,9 @@ def main() -> int:
     ingest_parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
     ingest_parser.set_defaults(func=cmd_ingest)
 
-    # review
+
+def _add_review_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the review command."""
     review_parser = subparsers.add_parser(
         "review",
         help="Review and decide on pending queue items",
@@ -575,14 +605,18 @@ def main() -> int:
     review_parser.add_argument("--reason", help="Reason for decision")
     review_parser.set_defaults(func=cmd_review)
 
-    # digest
+
+def _add_digest_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the digest command."""
     digest_parser = subparsers.add_parser(
         "digest",
         help="Generate review digest of pending queue items",
     )
     digest_parser.set_defaults(func=cmd_digest)
 
-    # delta
+
+def _add_delta_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the delta command."""
     delta_parser = subparsers.add_parser(
         "delta",
         help="Show delta report for a source",
@@ -591,7 +625,9 @@ def main() -> int:
     delta_parser.add_argument("--path", dest="delta_report_path", help="Path to delta report")
     delta_parser.set_defaults(func=cmd_delta)
 
-    # frontier
+
+def _add_frontier_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the frontier command."""
     frontier_parser = subparsers.add_parser(
         "frontier",
         help="Show knowledge frontier — topics with gaps or conflicts",
@@ -601,7 +637,9 @@ def main() -> int:
     frontier_parser.add_argument("--limit", type=int, help="Max results")
     frontier_parser.set_defaults(func=cmd_frontier)
 
-    # context
+
+def _add_context_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the context command."""
     context_parser = subparsers.add_parser(
         "context",
         help="Build a context pack for a goal",
@@ -613,7 +651,58 @@ def main() -> int:
     context_parser.add_argument("--strict", action="store_true", help="Enable strict mode")
     context_parser.set_defaults(func=cmd_context)
 
-    args = parser.parse_args()
+
+# Subcommand name -> parser builder. main() only builds the parser for the
+# command being run; help and unknown commands get the full set.
+_SUBCOMMAND_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "run": _add_run_parser,
+    "status": _add_status_parser,
+    "auto": _add_auto_parser,
+    "ingest": _add_ingest_parser,
+    "review": _add_review_parser,
+    "digest": _add_digest_parser,
+    "delta": _add_delta_parser,
+    "frontier": _add_frontier_parser,
+    "context": _add_context_parser,
+}
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None when all parsers are needed."""
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            # Top-level help lists every command.
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="mycelium-py",
+        description="Mycelium CLI - AI agent orchestration via LiteLLM",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose output",
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    command = _requested_command(argv)
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -10,20 +10,58 @@ Supports Anthropic, OpenAI, and Google via environment variables:
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
 import logging
 import math
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Iterator
 
-import litellm
+logger = logging.getLogger(__name__)
 
-# Configure litellm logging
-litellm.set_verbose = False
+# LiteLLM pulls in httpx, tokenizers and every provider SDK, which dominates
+# CLI startup. It is imported on first use so `--help`, `status` and dry runs
+# never pay for it.
+_litellm: Any = None
+
+
+def _load_litellm() -> Any:
+    """Import and configure LiteLLM once, on first use."""
+    global _litellm
+    if _litellm is None:
+        import litellm
+
+        # Configure litellm logging
+        litellm.set_verbose = False
+        _litellm = litellm
+    return _litellm
+
+
+def preload_client() -> threading.Thread:
+    """Import LiteLLM on a background thread.
+
+    Lets callers overlap the import with work that blocks anyway (e.g.
+    waiting for human approval) so the first completion starts sooner.
+    """
+    thread = threading.Thread(target=_load_litellm, name="litellm-preload", daemon=True)
+    thread.start()
+    return thread
 
-logger = logging.getLogger(__name__)
+
+def __getattr__(name: str) -> Any:
+    # Keep `mycelium.llm.litellm` available (e.g. as a patch target) without
+    # importing LiteLLM at module import time.
+    if name == "litellm":
+        return _load_litellm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Default model to use (Claude claude-sonnet-4-20250514)
 DEFAULT_MODEL = "anthropic/claude-sonnet-4-20250514"
@@ -32,6 +70,36 @@ DEFAULT_MODEL = "anthropic/claude-sonnet-4-20250514"
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
 BACKOFF_MULTIPLIER = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+# Model-name prefixes that identify a provider regardless of the "provider/"
+# segment (e.g. "claude-3-haiku", "gemini/gemini-pro").
+_MODEL_PREFIX_PROVIDERS = (
+    ("claude", "anthropic"),
+    ("gpt", "openai"),
+    ("gemini", "google"),
+)
+
+# Upper bound on concurrent provider calls made by complete_parallel().
+DEFAULT_PARALLEL_WORKERS = 16
+
+# Guards the shared rate-limit and response-cache state below, which
+# complete_parallel() workers read and update concurrently.
+_state_lock = threading.Lock()
+
+# Monotonic deadline per provider before which new calls wait instead of
+# hitting a rate limit that is known to still be in effect.
+_provider_cooldown_until: dict[str, float] = {}
+
+# Successful deterministic (temperature 0) responses keyed by a hash of the
+# request, so reruns of an identical prompt don't pay for it again.
+_RESPONSE_CACHE: dict[str, CompletionResponse] = {}
+_RESPONSE_CACHE_MAXSIZE = 512
+
+# Cacheable requests currently being sent, so identical concurrent calls
+# (e.g. from complete_parallel) wait for the first one instead of each
+# paying for the same response.
+_IN_FLIGHT: dict[str, threading.Event] = {}
 
 
 @dataclass
@@ -78,35 +146,261 @@ class CompletionResponse:
         return result
 
 
-def _calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+@functools.lru_cache(maxsize=4096)
+def _lookup_completion_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+) -> float | None:
+    """
+    Return LiteLLM's cost for a token count, or None if it can't price the model.
+    
+    Pricing is a pure function of its arguments, so results (including
+    unknown models) are memoized to skip LiteLLM's lookup on repeat calls.
+    """
+    litellm = _load_litellm()
+    try:
+        if cache_read_tokens or cache_creation_tokens:
+            # Only cost_per_token prices cached and cache-write prompt tokens
+            # at their own rates instead of the fresh input rate.
+            prompt_cost, completion_cost = litellm.cost_per_token(
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cache_read_input_tokens=cache_read_tokens,
+                cache_creation_input_tokens=cache_creation_tokens,
+            )
+            cost = prompt_cost + completion_cost
+            if not cost:
+                # Models missing from the cost map come back as (0.0, 0.0)
+                # here instead of raising; fall back to the estimate.
+                return None
+        else:
+            # LiteLLM provides cost calculation for many models
+            cost = litellm.completion_cost(
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+    except Exception:
+        return None
+    return cost if cost else 0.0
+
+
+def _calculate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+) -> float:
     """
     Calculate estimated USD cost for token usage.
     
+    prompt_tokens includes any cache_read_tokens (prompt prefix served from
+    the provider's prompt cache) and cache_creation_tokens (prefix written
+    to it); those are billed at their own rates rather than the input rate.
+    
     Uses LiteLLM's cost calculation when available, falls back to estimates.
     Note: These are estimates and may differ from actual provider billing.
     """
+    cost = _lookup_completion_cost(
+        model, prompt_tokens, completion_tokens, cache_read_tokens, cache_creation_tokens
+    )
+    if cost is not None:
+        return cost
+
+    # Fallback: rough estimates based on common pricing
+    # These are approximate and should be treated as estimates only
+    logger.warning(f"Could not calculate exact cost for {model}, using estimate")
+    
+    # Default pricing estimates (per 1M tokens)
+    # Updated to reflect cheaper modern models (Gemini 1.5/Flash, Claude Haiku)
+    input_cost_per_1m = 0.50   # $0.50 per 1M input tokens
+    output_cost_per_1m = 2.00  # $2.00 per 1M output tokens
+    # Cache reads and writes relative to the input rate (Anthropic's ratios)
+    cache_read_multiplier = 0.1
+    cache_creation_multiplier = 1.25
+    
+    fresh_tokens = max(0, prompt_tokens - cache_read_tokens - cache_creation_tokens)
+    billed_input_tokens = (
+        fresh_tokens
+        + cache_read_tokens * cache_read_multiplier
+        + cache_creation_tokens * cache_creation_multiplier
+    )
+    input_cost = (billed_input_tokens / 1_000_000) * input_cost_per_1m
+    output_cost = (completion_tokens / 1_000_000) * output_cost_per_1m
+    
+    return input_cost + output_cost
+
+
+def _jittered_backoff(backoff: float) -> float:
+    """Return a randomized delay in [backoff, 2 * backoff], capped at MAX_BACKOFF_SECONDS."""
+    return min(MAX_BACKOFF_SECONDS, backoff + random.uniform(0, backoff))
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """
+    Extract the provider's Retry-After hint from a rate-limit error.
+    
+    Accepts both delta-seconds and HTTP-date forms. Returns None when the
+    header is missing or unparseable, capped at MAX_BACKOFF_SECONDS otherwise.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
     try:
-        # LiteLLM provides cost calculation for many models
-        cost = litellm.completion_cost(
-            model=model,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-        )
-        return cost if cost else 0.0
+        raw_value = headers.get("retry-after")
     except Exception:
-        # Fallback: rough estimates based on common pricing
-        # These are approximate and should be treated as estimates only
-        logger.warning(f"Could not calculate exact cost for {model}, using estimate")
-        
-        # Default pricing estimates (per 1M tokens)
-        # Updated to reflect cheaper modern models (Gemini 1.5/Flash, Claude Haiku)
-        input_cost_per_1m = 0.50   # $0.50 per 1M input tokens
-        output_cost_per_1m = 2.00  # $2.00 per 1M output tokens
-        
-        input_cost = (prompt_tokens / 1_000_000) * input_cost_per_1m
-        output_cost = (completion_tokens / 1_000_000) * output_cost_per_1m
-        
-        return input_cost + output_cost
+        return None
+    if not isinstance(raw_value, str) or not raw_value.strip():
+        return None
+
+    raw_value = raw_value.strip()
+    try:
+        seconds = float(raw_value)
+    except ValueError:
+        # Only HTTP-date values need email.utils; keep it off the import path.
+        from email.utils import parsedate_to_datetime
+
+        try:
+            retry_at = parsedate_to_datetime(raw_value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    if not math.isfinite(seconds):
+        return None
+    return min(MAX_BACKOFF_SECONDS, max(0.0, seconds))
+
+
+def _response_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    tools: list[dict[str, Any]] | None,
+    tool_choice: str | None,
+) -> str | None:
+    """Hash a request into a response-cache key, or None if it must not be cached."""
+    if temperature != 0.0:
+        return None
+    try:
+        payload = json.dumps(
+            [model, messages, max_tokens, tools, tool_choice], sort_keys=True
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_response(cache_key: str) -> CompletionResponse | None:
+    """Return a copy of a cached response with zeroed usage, or None on a miss."""
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    # Nothing was sent to the provider, so nothing is billed.
+    return CompletionResponse(
+        content=cached.content,
+        usage=UsageMetadata(model=cached.usage.model),
+        success=True,
+        tool_calls=copy.deepcopy(cached.tool_calls),
+    )
+
+
+def _store_response(cache_key: str, response: CompletionResponse) -> None:
+    """Remember a successful response, evicting the oldest entry when full."""
+    stored = copy.deepcopy(response)
+    with _state_lock:
+        if cache_key not in _RESPONSE_CACHE and len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order).
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)), None)
+        _RESPONSE_CACHE[cache_key] = stored
+
+
+def _claim_in_flight(cache_key: str) -> threading.Event | None:
+    """
+    Claim a cacheable request, or wait for the caller already sending it.
+    
+    Returns an Event the caller must pass to _release_in_flight once its
+    response is stored, or None after waiting on another caller, in which
+    case the response cache holds its result if that call succeeded.
+    """
+    with _state_lock:
+        pending = _IN_FLIGHT.get(cache_key)
+        if pending is None:
+            claimed = _IN_FLIGHT[cache_key] = threading.Event()
+            return claimed
+    pending.wait()
+    return None
+
+
+def _release_in_flight(cache_key: str, claimed: threading.Event) -> None:
+    """Wake callers waiting on a claimed request."""
+    with _state_lock:
+        if _IN_FLIGHT.get(cache_key) is claimed:
+            del _IN_FLIGHT[cache_key]
+    claimed.set()
+
+
+def _with_prompt_cache_marker(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Mark the system prompt as a cacheable prefix for Anthropic prompt caching.
+    
+    Agent calls resend the same long system prompt (contract, instructions,
+    progress) on every tool iteration, so caching it server-side cuts the
+    billed prompt tokens on later turns. Returns a new list; the caller's
+    messages are left untouched.
+    """
+    for index, message in enumerate(messages):
+        if message.get("role") != "system":
+            continue
+        content = message.get("content")
+        if not isinstance(content, str) or not content:
+            return messages
+        marked = dict(message)
+        marked["content"] = [
+            {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}
+        ]
+        return [*messages[:index], marked, *messages[index + 1:]]
+    return messages
+
+
+def _model_provider(model: str) -> str:
+    """Return the API-key provider a model identifier is billed against."""
+    for prefix, provider in _MODEL_PREFIX_PROVIDERS:
+        if model.startswith(prefix):
+            return provider
+    provider, separator, _ = model.partition("/")
+    return provider if separator else "openai"
+
+
+def _is_retryable_error(litellm: Any, error: Exception) -> bool:
+    """Return True for transient failures: connection problems, timeouts and 5xx."""
+    if isinstance(
+        error,
+        (
+            litellm.APIConnectionError,
+            # litellm.Timeout derives from openai.APITimeoutError, not
+            # litellm.APIConnectionError, and carries a 408 status.
+            litellm.Timeout,
+            litellm.InternalServerError,
+            litellm.ServiceUnavailableError,
+            litellm.BadGatewayError,
+        ),
+    ):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return (
+        isinstance(error, litellm.APIError)
+        and isinstance(status_code, int)
+        and status_code >= 500
+    )
 
 
 def _verify_api_keys() -> list[str]:
@@ -222,6 +516,163 @@ def _normalize_message_content(raw_content: Any) -> str:
     return str(raw_content)
 
 
+def _wait_for_provider_cooldown(model_provider: str) -> None:
+    """
+    Sleep out a cooldown left by an earlier 429 for this provider.
+    
+    Avoids spending a round trip on a request the provider is known to reject.
+    """
+    cooldown = _provider_cooldown_until.get(model_provider, 0.0) - time.monotonic()
+    if cooldown > 0:
+        logger.info(f"Provider {model_provider} cooling down, waiting {cooldown:.1f}s...")
+        time.sleep(cooldown)
+
+
+def _record_rate_limit(model_provider: str, seconds: float) -> None:
+    """Hold back new calls to a provider for the given number of seconds."""
+    cooldown_until = time.monotonic() + seconds
+    with _state_lock:
+        # Concurrent callers may have set a later deadline; keep it.
+        _provider_cooldown_until[model_provider] = max(
+            cooldown_until, _provider_cooldown_until.get(model_provider, 0.0)
+        )
+
+
+def _effective_temperature(model: str, temperature: float) -> float:
+    """Return the temperature actually sent to the provider for model."""
+    # Adjust temperature for specific models that require it
+    # Gemini models often fail/warn with temp < 1.0
+    if "gemini" in model.lower() and temperature == 0.0:
+        return 1.0
+    return temperature
+
+
+def _build_completion_kwargs(
+    model: str,
+    model_provider: str,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    tools: list[dict[str, Any]] | None,
+    tool_choice: str | None,
+) -> dict[str, Any]:
+    """Build the keyword arguments for litellm.completion."""
+    completion_kwargs: dict[str, Any] = {
+        "model": model,
+        "messages": (
+            _with_prompt_cache_marker(messages)
+            if model_provider == "anthropic"
+            else messages
+        ),
+        "max_tokens": max_tokens,
+    }
+    
+    completion_kwargs["temperature"] = _effective_temperature(model, temperature)
+    if completion_kwargs["temperature"] != temperature:
+        logger.info(
+            f"Adjusting temperature to {completion_kwargs['temperature']} for model: {model}"
+        )
+    
+    # Add tools if provided
+    if tools:
+        completion_kwargs["tools"] = tools
+        if tool_choice:
+            completion_kwargs["tool_choice"] = tool_choice
+
+    return completion_kwargs
+
+
+def _extract_tool_calls(raw_tool_calls: Any) -> list[dict[str, Any]] | None:
+    """Normalize a provider tool-call payload, or return None if there are none."""
+    if not raw_tool_calls:
+        return None
+
+    if isinstance(raw_tool_calls, list):
+        tool_call_items = raw_tool_calls
+    else:
+        tool_call_items = [raw_tool_calls]
+
+    normalized_tool_calls = []
+    for idx, raw_tool_call in enumerate(tool_call_items, start=1):
+        normalized = _normalize_tool_call(raw_tool_call, idx)
+        if normalized:
+            normalized_tool_calls.append(normalized)
+        else:
+            logger.warning(f"Skipping malformed tool call payload: {raw_tool_call!r}")
+
+    if not normalized_tool_calls:
+        return None
+    logger.info(f"LLM returned {len(normalized_tool_calls)} tool call(s)")
+    return normalized_tool_calls
+
+
+def _build_usage(model: str, usage_data: Any) -> UsageMetadata:
+    """Build usage metadata, with estimated cost, from a provider usage payload."""
+    prompt_tokens = _coerce_non_negative_int(getattr(usage_data, "prompt_tokens", 0))
+    completion_tokens = _coerce_non_negative_int(getattr(usage_data, "completion_tokens", 0))
+    reported_total_tokens = _coerce_non_negative_int(getattr(usage_data, "total_tokens", 0))
+    total_tokens = reported_total_tokens or (prompt_tokens + completion_tokens)
+    # Anthropic reports cache reads/writes directly; OpenAI and Gemini report
+    # cached prompt tokens under prompt_tokens_details.
+    cache_read_tokens = _coerce_non_negative_int(
+        getattr(usage_data, "cache_read_input_tokens", 0)
+    ) or _coerce_non_negative_int(
+        getattr(getattr(usage_data, "prompt_tokens_details", None), "cached_tokens", 0)
+    )
+    cache_creation_tokens = _coerce_non_negative_int(
+        getattr(usage_data, "cache_creation_input_tokens", 0)
+    )
+    
+    # Calculate cost
+    try:
+        cost_usd = _calculate_cost(
+            model, prompt_tokens, completion_tokens, cache_read_tokens, cache_creation_tokens
+        )
+    except Exception as e:
+        logger.warning(f"Cost calculation failed for {model}: {e}")
+        cost_usd = 0.0
+
+    if not isinstance(cost_usd, (int, float)) or not math.isfinite(cost_usd) or cost_usd < 0:
+        cost_usd = 0.0
+    
+    return UsageMetadata(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=total_tokens,
+        cost_usd=cost_usd,
+        model=model,
+    )
+
+
+def _merge_tool_call_delta(partials: dict[int, dict[str, str]], raw_delta: Any) -> None:
+    """Fold one streamed tool-call fragment into the calls assembled so far."""
+    if isinstance(raw_delta, dict):
+        index = raw_delta.get("index")
+        call_id = raw_delta.get("id")
+        raw_function = raw_delta.get("function")
+    else:
+        index = getattr(raw_delta, "index", None)
+        call_id = getattr(raw_delta, "id", None)
+        raw_function = getattr(raw_delta, "function", None)
+
+    if isinstance(raw_function, dict):
+        name = raw_function.get("name")
+        arguments = raw_function.get("arguments")
+    else:
+        name = getattr(raw_function, "name", None)
+        arguments = getattr(raw_function, "arguments", None)
+
+    if not isinstance(index, int) or isinstance(index, bool):
+        index = len(partials)
+    partial = partials.setdefault(index, {"id": "", "name": "", "arguments": ""})
+    if isinstance(call_id, str) and call_id:
+        partial["id"] = call_id
+    if isinstance(name, str):
+        partial["name"] += name
+    if isinstance(arguments, str):
+        partial["arguments"] += arguments
+
+
 def complete(
     messages: list[dict[str, Any]],
     model: str = DEFAULT_MODEL,
@@ -265,19 +716,7 @@ def complete(
         )
     
     # Check if the requested model's provider is available
-    model_provider = model.split("/")[0] if "/" in model else "openai"
-    
-    # Map common aliases
-    provider_aliases = {
-        "claude": "anthropic",
-        "gpt": "openai", 
-        "gemini": "google",
-    }
-    
-    for alias, provider in provider_aliases.items():
-        if model.startswith(alias):
-            model_provider = provider
-            break
+    model_provider = _model_provider(model)
     
     if model_provider not in available_providers:
         logger.warning(
@@ -285,37 +724,70 @@ def complete(
             f"Available: {available_providers}"
         )
     
+    # Key on the temperature the provider will see: a request bumped off 0
+    # (e.g. for Gemini) is sampled, so it must not be cached.
+    cache_key = _response_cache_key(
+        model, messages, _effective_temperature(model, temperature),
+        max_tokens, tools, tool_choice,
+    )
+    if cache_key is not None:
+        cached = _cached_response(cache_key)
+        if cached is None:
+            claimed = _claim_in_flight(cache_key)
+            if claimed is not None:
+                try:
+                    return _complete_with_retries(
+                        messages, model, model_provider, agent_role,
+                        temperature, max_tokens, tools, tool_choice, cache_key,
+                    )
+                finally:
+                    _release_in_flight(cache_key, claimed)
+            # An identical request just finished; reuse it if it succeeded.
+            cached = _cached_response(cache_key)
+        if cached is not None:
+            logger.info(f"LLM cache hit: model={model}, agent={agent_role}")
+            return cached
+
+    return _complete_with_retries(
+        messages, model, model_provider, agent_role,
+        temperature, max_tokens, tools, tool_choice, cache_key,
+    )
+
+
+def _complete_with_retries(
+    messages: list[dict[str, Any]],
+    model: str,
+    model_provider: str,
+    agent_role: str,
+    temperature: float,
+    max_tokens: int,
+    tools: list[dict[str, Any]] | None,
+    tool_choice: str | None,
+    cache_key: str | None,
+) -> CompletionResponse:
+    """Send a completion to the provider, retrying transient failures."""
+    litellm = _load_litellm()
+
+    # Retries below sleep for at least as long as the cooldown they set, so
+    # the gate only needs checking before the first attempt.
+    _wait_for_provider_cooldown(model_provider)
+
+    # Build completion kwargs once; only the attempt number changes between retries.
+    completion_kwargs = _build_completion_kwargs(
+        model, model_provider, messages, temperature, max_tokens, tools, tool_choice
+    )
+    
     # Retry loop with exponential backoff
     last_error: str | None = None
     backoff = INITIAL_BACKOFF_SECONDS
     
     for attempt in range(1, MAX_RETRIES + 1):
+        retry_after: float | None = None
         try:
             logger.info(
                 f"LLM call: model={model}, agent={agent_role}, attempt={attempt}/{MAX_RETRIES}"
             )
             
-            # Build completion kwargs
-            completion_kwargs = {
-                "model": model,
-                "messages": messages,
-                "max_tokens": max_tokens,
-            }
-            
-            # Adjust temperature for specific models that require it
-            # Gemini models often fail/warn with temp < 1.0
-            if "gemini" in model.lower() and temperature == 0.0:
-                logger.info(f"Adjusting temperature to 1.0 for Gemini model: {model}")
-                completion_kwargs["temperature"] = 1.0
-            else:
-                completion_kwargs["temperature"] = temperature
-            
-            # Add tools if provided
-            if tools:
-                completion_kwargs["tools"] = tools
-                if tool_choice:
-                    completion_kwargs["tool_choice"] = tool_choice
-            
             response = litellm.completion(**completion_kwargs)
             
             # Extract response content
@@ -323,65 +795,30 @@ def complete(
             content = _normalize_message_content(getattr(message, "content", ""))
             
             # Extract tool calls if present
-            extracted_tool_calls = None
-            raw_tool_calls = getattr(message, "tool_calls", None)
-            if raw_tool_calls:
-                if isinstance(raw_tool_calls, list):
-                    tool_call_items = raw_tool_calls
-                else:
-                    tool_call_items = [raw_tool_calls]
-
-                normalized_tool_calls = []
-                for idx, raw_tool_call in enumerate(tool_call_items, start=1):
-                    normalized = _normalize_tool_call(raw_tool_call, idx)
-                    if normalized:
-                        normalized_tool_calls.append(normalized)
-                    else:
-                        logger.warning(f"Skipping malformed tool call payload: {raw_tool_call!r}")
-
-                if normalized_tool_calls:
-                    extracted_tool_calls = normalized_tool_calls
-                    logger.info(f"LLM returned {len(extracted_tool_calls)} tool call(s)")
+            extracted_tool_calls = _extract_tool_calls(getattr(message, "tool_calls", None))
             
-            # Extract usage metadata
-            usage_data = getattr(response, "usage", None)
-            prompt_tokens = _coerce_non_negative_int(getattr(usage_data, "prompt_tokens", 0))
-            completion_tokens = _coerce_non_negative_int(getattr(usage_data, "completion_tokens", 0))
-            reported_total_tokens = _coerce_non_negative_int(getattr(usage_data, "total_tokens", 0))
-            total_tokens = reported_total_tokens or (prompt_tokens + completion_tokens)
-            
-            # Calculate cost
-            try:
-                cost_usd = _calculate_cost(model, prompt_tokens, completion_tokens)
-            except Exception as e:
-                logger.warning(f"Cost calculation failed for {model}: {e}")
-                cost_usd = 0.0
-
-            if not isinstance(cost_usd, (int, float)) or not math.isfinite(cost_usd) or cost_usd < 0:
-                cost_usd = 0.0
-            
-            usage = UsageMetadata(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-                cost_usd=cost_usd,
-                model=model,
-            )
+            # Extract usage metadata and cost
+            usage = _build_usage(model, getattr(response, "usage", None))
             
             logger.info(
-                f"LLM success: tokens={total_tokens}, cost=${cost_usd:.6f}"
+                f"LLM success: tokens={usage.total_tokens}, cost=${usage.cost_usd:.6f}"
             )
             
-            return CompletionResponse(
+            result = CompletionResponse(
                 content=content,
                 usage=usage,
                 success=True,
                 tool_calls=extracted_tool_calls,
             )
+            if cache_key is not None:
+                _store_response(cache_key, result)
+            return result
             
         except litellm.RateLimitError as e:
             last_error = f"Rate limit exceeded: {e}"
             logger.warning(f"Rate limit hit, attempt {attempt}/{MAX_RETRIES}: {e}")
+            retry_after = _retry_after_seconds(e)
+            _record_rate_limit(model_provider, retry_after if retry_after is not None else backoff)
             
         except litellm.AuthenticationError as e:
             # Don't retry auth errors
@@ -398,13 +835,24 @@ def complete(
             )
             
         except Exception as e:
+            if not _is_retryable_error(litellm, e):
+                # Permanent provider errors (404, 403, 422) and bugs such as a
+                # malformed response fail the same way on every attempt.
+                logger.error(f"LLM call failed with non-retryable error: {e!r}")
+                return CompletionResponse(
+                    success=False,
+                    error=f"LLM error: {e}",
+                )
             last_error = f"LLM error: {e}"
             logger.warning(f"LLM call failed, attempt {attempt}/{MAX_RETRIES}: {e}")
         
-        # Exponential backoff before retry
+        # Exponential backoff before retry, with jitter so concurrent callers
+        # that hit the same rate limit don't all retry at the same instant.
+        # A provider Retry-After hint takes precedence over the local schedule.
         if attempt < MAX_RETRIES:
-            logger.info(f"Retrying in {backoff:.1f}s...")
-            time.sleep(backoff)
+            delay = retry_after if retry_after is not None else _jittered_backoff(backoff)
+            logger.info(f"Retrying in {delay:.1f}s...")
+            time.sleep(delay)
             backoff *= BACKOFF_MULTIPLIER
     
     # All retries exhausted
@@ -412,3 +860,166 @@ def complete(
         success=False,
         error=f"Failed after {MAX_RETRIES} retries. Last error: {last_error}",
     )
+
+
+def complete_stream(
+    messages: list[dict[str, Any]],
+    model: str = DEFAULT_MODEL,
+    agent_role: str = "",
+    temperature: float = 0.0,
+    max_tokens: int = 8192,
+    tools: list[dict[str, Any]] | None = None,
+    tool_choice: str | None = None,
+) -> Iterator[CompletionResponse]:
+    """
+    Execute LLM completion via LiteLLM, yielding partial responses as tokens arrive.
+    
+    Takes the same arguments as complete(). Each yielded response carries the
+    content received so far; the last one also carries tool calls and usage
+    metadata, or success=False and the error if the call failed.
+    
+    Streamed calls are not retried or cached, since earlier chunks may
+    already have been consumed by the caller.
+    """
+    if not _verify_api_keys():
+        yield CompletionResponse(
+            success=False,
+            error="No API keys found. Set ANTHROPIC_API_KEY, OPENAI_API_KEY, or GOOGLE_API_KEY.",
+        )
+        return
+
+    model_provider = _model_provider(model)
+    litellm = _load_litellm()
+    _wait_for_provider_cooldown(model_provider)
+
+    completion_kwargs = _build_completion_kwargs(
+        model, model_provider, messages, temperature, max_tokens, tools, tool_choice
+    )
+    completion_kwargs["stream"] = True
+    completion_kwargs["stream_options"] = {"include_usage": True}
+
+    logger.info(f"LLM stream: model={model}, agent={agent_role}")
+
+    content = ""
+    tool_call_parts: dict[int, dict[str, str]] = {}
+    usage_data = None
+    try:
+        for chunk in litellm.completion(**completion_kwargs):
+            chunk_usage = getattr(chunk, "usage", None)
+            if chunk_usage is not None:
+                usage_data = chunk_usage
+
+            choices = getattr(chunk, "choices", None)
+            if not choices:
+                continue
+            delta = getattr(choices[0], "delta", None)
+
+            for raw_delta in getattr(delta, "tool_calls", None) or []:
+                _merge_tool_call_delta(tool_call_parts, raw_delta)
+
+            text = getattr(delta, "content", None)
+            if isinstance(text, str) and text:
+                content += text
+                yield CompletionResponse(content=content)
+
+    except litellm.RateLimitError as e:
+        retry_after = _retry_after_seconds(e)
+        _record_rate_limit(
+            model_provider, retry_after if retry_after is not None else INITIAL_BACKOFF_SECONDS
+        )
+        yield CompletionResponse(content=content, success=False, error=f"Rate limit exceeded: {e}")
+        return
+
+    except litellm.AuthenticationError as e:
+        yield CompletionResponse(
+            content=content,
+            success=False,
+            error=f"Authentication failed: {e}. Check your API key.",
+        )
+        return
+
+    except Exception as e:
+        logger.warning(f"LLM stream failed: {e}")
+        yield CompletionResponse(content=content, success=False, error=f"LLM error: {e}")
+        return
+
+    tool_calls = _extract_tool_calls([
+        {
+            "id": partial["id"] or None,
+            "function": {"name": partial["name"], "arguments": partial["arguments"] or None},
+        }
+        for _, partial in sorted(tool_call_parts.items())
+    ])
+    usage = _build_usage(model, usage_data)
+
+    logger.info(f"LLM stream success: tokens={usage.total_tokens}, cost=${usage.cost_usd:.6f}")
+
+    yield CompletionResponse(content=content, usage=usage, success=True, tool_calls=tool_calls)
+
+
+def complete_parallel(
+    requests: list[dict[str, Any]],
+    max_workers: int = DEFAULT_PARALLEL_WORKERS,
+) -> list[CompletionResponse]:
+    """
+    Run independent completions concurrently.
+    
+    Args:
+        requests: Keyword-argument dicts, each passed to complete() as-is.
+        max_workers: Maximum number of calls in flight at once.
+    
+    Returns:
+        One CompletionResponse per request, in the same order as requests.
+    
+    Workers share complete()'s rate-limit cooldown and response cache, so a
+    429 seen by one worker holds back the others instead of each of them
+    hitting the provider.
+    """
+    if not requests:
+        return []
+
+    workers = max(1, min(max_workers, len(requests)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda request: complete(**request), requests))
+
+
+def complete_batch(
+    messages_list: list[list[dict[str, Any]]],
+    max_workers: int = DEFAULT_PARALLEL_WORKERS,
+    **kwargs: Any,
+) -> list[CompletionResponse]:
+    """
+    Run the same completion settings over several message lists.
+    
+    Args:
+        messages_list: One message list per completion.
+        max_workers: Maximum number of calls in flight at once.
+        **kwargs: Other complete() arguments (model, agent_role, tools, ...)
+            shared by every call.
+    
+    Returns:
+        One CompletionResponse per message list, in the same order.
+    
+    When every list starts with the same system prompt, the first call runs
+    alone so the provider's prompt cache holds that prefix before the rest
+    are sent concurrently; otherwise each call would pay the full prompt
+    price because none of them finished writing the cache yet.
+    """
+    requests = [{"messages": messages, **kwargs} for messages in messages_list]
+    if len(requests) < 2:
+        return complete_parallel(requests, max_workers=max_workers)
+
+    first_messages = messages_list[0]
+    shared_prefix = (
+        bool(first_messages)
+        and first_messages[0].get("role") == "system"
+        and all(
+            messages and messages[0] == first_messages[0]
+            for messages in messages_list[1:]
+        )
+    )
+    if not shared_prefix:
+        return complete_parallel(requests, max_workers=max_workers)
+
+    first = complete(**requests[0])
+    return [first, *complete_parallel(requests[1:], max_workers=max_workers)]
@@ -13,17 +13,45 @@ Implements 7 tools for MCP-compatible clients:
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import codecs
 import fcntl
+import fnmatch
+import io
+import json
+import mmap
 import os
 import re
+import selectors
 import shlex
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 from fastmcp import FastMCP
 
+try:
+    import re2
+except ImportError:  # optional: pip install 'mycelium[search]'
+    re2 = None
+
+from mycelium.progress_cache import (
+    ProgressDumper,
+    cache_progress,
+    invalidate_progress,
+    load_progress_cached,
+)
+
+# libyaml-backed safe loader/dumper for extraction bundles; progress.yaml
+# goes through the shared progress cache instead.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Create the MCP server instance
 mcp = FastMCP("Mycelium MCP Server")
 
@@ -46,6 +74,33 @@ COMMAND_ALLOWLIST = frozenset({
 # Set MYCELIUM_MCP_SANDBOX_ROOT to override. Defaults to cwd.
 SANDBOX_ROOT = Path(os.environ.get("MYCELIUM_MCP_SANDBOX_ROOT", ".")).resolve()
 
+# Directories and file extensions search_codebase never looks inside.
+SEARCH_SKIP_DIRS = frozenset({".git", ".venv", "__pycache__", "node_modules", ".mycelium/bin"})
+SEARCH_SKIP_EXTENSIONS = frozenset({
+    ".pyc", ".pyo", ".so", ".dylib", ".dll", ".exe", ".bin", ".jpg", ".png", ".gif", ".ico",
+})
+
+# Output kept per stream (stdout/stderr) by run_command; the rest is dropped.
+RUN_COMMAND_MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Largest file read_file returns in one piece; bigger files are read in ranges.
+READ_FILE_MAX_BYTES = 10 * 1024 * 1024
+
+# Upper bound on threads reading files concurrently in the Python search path.
+SEARCH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# ripgrep, if installed, serves literal searches far faster than the Python scan.
+RIPGREP_PATH = shutil.which("rg")
+
+# Syntax that RE2 and Python's re read differently: shorthand classes are
+# ASCII-only in RE2 and "[[:alpha:]]" is a POSIX class only in RE2. Patterns
+# using them stay on the re engine.
+_RE2_INCOMPATIBLE_RE = re.compile(r"\\[wWdDsSbB]|\[:")
+
+# Non-ASCII characters that str regexes treat as case variants of an ASCII
+# letter (e.g. KELVIN SIGN for "k"). Byte-level prefilters must accept them.
+_ASCII_CASE_VARIANTS = {"i": "\u0130\u0131", "k": "\u212a", "s": "\u017f"}
+
 
 class PathNotAllowedError(ValueError):
     """Raised when a path escapes the MCP sandbox root."""
@@ -121,8 +176,7 @@ def _get_current_agent(mission_path: str) -> str | None:
         return None
 
     try:
-        with open(progress_file) as f:
-            progress = yaml.safe_load(f) or {}
+        progress = load_progress_cached(progress_file)[0] or {}
         if not isinstance(progress, dict):
             return None
         normalized = _normalize_agent_value(progress.get("current_agent", ""))
@@ -193,13 +247,12 @@ def _read_progress(mission_path: str) -> dict[str, Any]:
         raise FileNotFoundError(f"progress.yaml not found at: {progress_file}")
     
     try:
-        with open(progress_file) as f:
-            content = yaml.safe_load(f)
-            if content is None:
-                return {}
-            if not isinstance(content, dict):
-                raise ValueError(f"Expected YAML dict, got {type(content).__name__}")
-            return content
+        content = load_progress_cached(progress_file)[0]
+        if content is None:
+            return {}
+        if not isinstance(content, dict):
+            raise ValueError(f"Expected YAML dict, got {type(content).__name__}")
+        return content
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse YAML: {e}")
 
@@ -259,8 +312,7 @@ def _update_progress(mission_path: str, section: str, data: Any) -> dict[str, An
         fcntl.flock(lock_fd, fcntl.LOCK_EX)
 
         try:
-            with open(progress_file) as f:
-                progress = yaml.safe_load(f) or {}
+            progress = load_progress_cached(progress_file)[0] or {}
         except yaml.YAMLError as e:
             raise ValueError(f"Failed to parse existing YAML: {e}")
 
@@ -318,11 +370,23 @@ def _update_progress(mission_path: str, section: str, data: Any) -> dict[str, An
             progress[section] = data
 
         # Write back
+        invalidate_progress(progress_file)
+        from mycelium.atomic_write import atomic_write_text
+
+        # Serialize fully before touching the file, then swap it in atomically
+        # so a crash mid-write never leaves a truncated progress.yaml.
         try:
-            with open(progress_file, "w") as f:
-                yaml.safe_dump(progress, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            serialized = yaml.dump(
+                progress,
+                Dumper=ProgressDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+            atomic_write_text(progress_file, serialized, mkdir=False, preserve_mode=True)
         except Exception as e:
             raise ValueError(f"Failed to write YAML: {e}")
+        cache_progress(progress_file, progress, serialized)
 
         return progress
     finally:
@@ -357,22 +421,25 @@ def _list_files(directory: str, include_hidden: bool = False) -> list[dict[str,
     results = []
     
     try:
-        for item in path.iterdir():
-            if not include_hidden and item.name.startswith("."):
-                continue
-            
-            entry = {
-                "name": item.name,
-                "type": "directory" if item.is_dir() else "file",
-            }
-            
-            if item.is_file():
-                try:
-                    entry["size"] = item.stat().st_size
-                except OSError:
-                    entry["size"] = None
-            
-            results.append(entry)
+        # DirEntry caches the file type from the directory read, so only
+        # symlinks and the size lookup cost a stat call.
+        with os.scandir(path) as entries:
+            for item in entries:
+                if not include_hidden and item.name.startswith("."):
+                    continue
+                
+                entry = {
+                    "name": item.name,
+                    "type": "directory" if item.is_dir() else "file",
+                }
+                
+                if item.is_file():
+                    try:
+                        entry["size"] = item.stat().st_size
+                    except OSError:
+                        entry["size"] = None
+                
+                results.append(entry)
     except PermissionError as e:
         raise PermissionError(f"Permission denied: {directory}") from e
     
@@ -382,20 +449,56 @@ def _list_files(directory: str, include_hidden: bool = False) -> list[dict[str,
     return results
 
 
-def _read_file(file_path: str, encoding: str = "utf-8") -> str:
+def _read_text_mapped(path: Path, encoding: str, size: int) -> str:
+    """
+    Decode a whole file straight from an mmap of it.
+
+    Skips the intermediate bytes object a buffered read() allocates, and
+    translates newlines the way Path.read_text does. Empty or unmappable
+    files (e.g. under /proc) fall back to Path.read_text.
     """
-    Read contents of a file.
+    if size == 0:
+        return path.read_text(encoding=encoding)
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                text = str(view, encoding)
+    except UnicodeDecodeError:
+        raise
+    except (OSError, ValueError):
+        return path.read_text(encoding=encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_file(
+    file_path: str,
+    encoding: str = "utf-8",
+    offset: int = 0,
+    max_bytes: int | None = None,
+) -> str:
+    """
+    Read contents of a file, or a byte range of it.
 
     Args:
         file_path: Path to file to read.
         encoding: Character encoding to use (default: utf-8).
+        offset: Byte offset to start reading from (default: 0).
+        max_bytes: Maximum number of bytes to read, capped at
+            READ_FILE_MAX_BYTES. If omitted, the rest of the file from
+            offset is read, provided it fits within READ_FILE_MAX_BYTES.
 
     Returns:
-        File contents as string.
+        File contents as string. For UTF-8, ranges at offset, offset +
+        max_bytes, ... compose into the whole-file text: a character (or
+        "\r\n") cut off by max_bytes is left for the next range, which
+        starts at that character's first byte.
 
     Raises:
         FileNotFoundError: If file doesn't exist.
-        ValueError: If encoding fails.
+        ValueError: If encoding fails, the range is invalid, or a read
+            without max_bytes exceeds READ_FILE_MAX_BYTES.
         PathNotAllowedError: If path escapes the sandbox.
     """
     path = _safe_resolve(file_path)
@@ -405,9 +508,61 @@ def _read_file(file_path: str, encoding: str = "utf-8") -> str:
 
     if path.is_dir():
         raise IsADirectoryError(f"Path is a directory, not a file: {file_path}")
+
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative")
     
     try:
-        return path.read_text(encoding=encoding)
+        if offset == 0 and max_bytes is None:
+            size = path.stat().st_size
+            if size > READ_FILE_MAX_BYTES:
+                raise ValueError(
+                    f"File is {size} bytes, over the {READ_FILE_MAX_BYTES}-byte limit "
+                    f"for whole-file reads; use offset/max_bytes to read it in ranges"
+                )
+            return _read_text_mapped(path, encoding, size)
+
+        size = path.stat().st_size
+        if max_bytes is None:
+            remaining = max(0, size - offset)
+            if remaining > READ_FILE_MAX_BYTES:
+                raise ValueError(
+                    f"{remaining} bytes remain after offset {offset}, over the "
+                    f"{READ_FILE_MAX_BYTES}-byte read limit; pass max_bytes"
+                )
+            limit = READ_FILE_MAX_BYTES
+        else:
+            limit = min(max_bytes, READ_FILE_MAX_BYTES)
+        end = min(offset + limit, size)
+
+        # For UTF-8, look back far enough to find where the character at
+        # offset starts and whether a "\r" precedes it.
+        utf8 = codecs.lookup(encoding).name == "utf-8"
+        window_start = max(0, offset - 4) if utf8 else offset
+        with open(path, "rb") as f:
+            f.seek(window_start)
+            data = f.read(max(0, end - window_start))
+        start = offset - window_start
+        if utf8 and start < len(data):
+            # A range owns the characters that end inside it: start at the
+            # lead byte of a character split by the previous range's end,
+            # and take over a "\r" that range held back.
+            lead = start
+            while lead > 0 and start - lead < 3 and 0x80 <= data[lead] < 0xC0:
+                lead -= 1
+            start = lead
+            if start > 0 and data[start - 1] == 0x0D:
+                start -= 1
+
+        # Translate newlines like the whole-file path. Until EOF, final=False
+        # holds back a multi-byte character (or a "\r" that may pair with a
+        # "\n") split at the end of the range.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        return decoder.decode(data[start:], final=end >= size)
     except UnicodeDecodeError as e:
         raise ValueError(f"Failed to decode file with {encoding} encoding: {e}")
     except PermissionError as e:
@@ -469,6 +624,63 @@ def _write_file(
         }
 
 
+def _decode_command_output(data: bytearray, dropped: int) -> str:
+    """Decode captured output with universal newlines, noting any truncation."""
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    if dropped:
+        text += f"\n...[truncated {dropped} bytes]"
+    return text
+
+
+def _communicate_capped(proc: subprocess.Popen[bytes], timeout: float) -> tuple[str, str]:
+    """
+    Drain a process's stdout and stderr as output arrives.
+
+    Keeps at most RUN_COMMAND_MAX_OUTPUT_BYTES of each stream; the rest is
+    read and discarded so the child never blocks on a full pipe.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process outlives timeout; it is
+            killed first.
+    """
+    captured = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    dropped = {proc.stdout: 0, proc.stderr: 0}
+    deadline = time.monotonic() + timeout
+
+    with selectors.DefaultSelector() as selector:
+        for stream in captured:
+            selector.register(stream, selectors.EVENT_READ)
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+                buffer = captured[key.fileobj]
+                room = max(0, RUN_COMMAND_MAX_OUTPUT_BYTES - len(buffer))
+                buffer += chunk[:room]
+                dropped[key.fileobj] += len(chunk) - min(room, len(chunk))
+
+    try:
+        proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+
+    return (
+        _decode_command_output(captured[proc.stdout], dropped[proc.stdout]),
+        _decode_command_output(captured[proc.stderr], dropped[proc.stderr]),
+    )
+
+
 def _run_command(
     command: str,
     cwd: str = "",
@@ -540,20 +752,20 @@ def _run_command(
         working_dir = None
 
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             argv,
             shell=False,
             cwd=working_dir,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            stdout, stderr = _communicate_capped(proc, timeout)
 
         return {
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "exit_code": result.returncode,
+            "success": proc.returncode == 0,
+            "stdout": stdout,
+            "stderr": stderr,
+            "exit_code": proc.returncode,
         }
     except subprocess.TimeoutExpired:
         return {
@@ -575,6 +787,224 @@ def _run_command(
         }
 
 
+def _ripgrep_text(value: dict[str, Any]) -> str:
+    """Decode a ripgrep JSON text field, which is base64 bytes when not UTF-8."""
+    if "text" in value:
+        return value["text"]
+    return base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="ignore")
+
+
+def _search_with_ripgrep(
+    rg_path: str,
+    pattern: str,
+    path: Path,
+    file_pattern: str,
+    case_insensitive: bool,
+    result_limit: int,
+) -> list[dict[str, Any]] | None:
+    """
+    Run a literal search through ripgrep.
+    
+    Flags mirror the Python scan: hidden and gitignored files are searched,
+    binary files are read as text, and the same directories and extensions
+    are skipped. ripgrep searches files in parallel and reports them in
+    completion order, so the capped results are sorted by path and line
+    afterwards (--sort would force it onto a single thread).
+    
+    Returns:
+        Match dicts in the _search_codebase shape, or None if ripgrep failed
+        and the caller should fall back to the Python scan.
+    """
+    cmd = [
+        rg_path,
+        "--json",
+        "--fixed-strings",
+        "--no-ignore",
+        "--hidden",
+        "--text",
+        "--no-messages",
+        "--ignore-case" if case_insensitive else "--case-sensitive",
+    ]
+    if file_pattern:
+        cmd += ["--glob", file_pattern]
+    # Later globs take precedence, so exclusions go after the include pattern.
+    for skip_dir in sorted(SEARCH_SKIP_DIRS):
+        cmd += ["--glob", f"!{skip_dir}"]
+    for extension in sorted(SEARCH_SKIP_EXTENSIONS):
+        cmd += ["--iglob", f"!*{extension}"]
+    cmd += ["--", pattern, str(path)]
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+    except OSError:
+        return None
+
+    results: list[dict[str, Any]] = []
+    truncated = False
+    try:
+        for raw_event in proc.stdout:
+            try:
+                event = json.loads(raw_event)
+            except ValueError:
+                continue
+            if event.get("type") != "match":
+                continue
+            data = event["data"]
+            results.append({
+                "file": _ripgrep_text(data["path"]),
+                "line_number": data["line_number"],
+                "content": _ripgrep_text(data["lines"]).strip(),
+            })
+            if len(results) >= result_limit:
+                truncated = True
+                break
+    finally:
+        proc.stdout.close()
+        if truncated:
+            proc.kill()
+        proc.wait()
+
+    # Exit code 1 means no matches; 2 means an error, which only matters if
+    # it left us with nothing to report.
+    if not truncated and proc.returncode not in (0, 1) and not results:
+        return None
+    results.sort(key=lambda match: (match["file"], match["line_number"]))
+    return results
+
+
+def _iter_search_files(root: Path, file_pattern: str = "") -> Iterator[Path]:
+    """
+    Yield searchable files under root, pruning skipped directories.
+    
+    Skipped directories are never descended into, so trees like .venv and
+    node_modules cost one directory entry rather than a stat per file.
+    Symlinked directories are not followed, matching Path.rglob.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    if name in SEARCH_SKIP_DIRS:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if f"{directory.name}/{name}" not in SEARCH_SKIP_DIRS:
+                                subdirs.append(directory / name)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if os.path.splitext(name)[1].lower() in SEARCH_SKIP_EXTENSIONS:
+                        continue
+                    if file_pattern and not fnmatch.fnmatchcase(name, file_pattern):
+                        continue
+                    yield directory / name
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+        # Reverse so subdirectories are visited in scandir order.
+        stack.extend(reversed(subdirs))
+
+
+def _compile_linear_regex(pattern: str, case_insensitive: bool) -> Any | None:
+    """Compile a regex with RE2, which matches in linear time, if possible.
+
+    Returns None when RE2 isn't installed, doesn't support the pattern
+    (e.g. backreferences or lookaround), or would match it differently.
+    """
+    if re2 is None or _RE2_INCOMPATIBLE_RE.search(pattern):
+        return None
+    options = re2.Options()
+    options.case_sensitive = not case_insensitive
+    options.log_errors = False
+    try:
+        return re2.compile(pattern, options)
+    except re2.error:
+        return None
+
+
+def _literal_prefilter(pattern: str, case_insensitive: bool) -> re.Pattern[bytes] | None:
+    """Compile a bytes regex that matches wherever a literal search could.
+
+    Returns None when no byte pattern is exact enough, i.e. for
+    case-insensitive patterns with non-ASCII characters.
+    """
+    if not case_insensitive:
+        return re.compile(re.escape(pattern.encode("utf-8")))
+    if not pattern.isascii():
+        return None
+
+    parts = []
+    for char in pattern:
+        escaped = re.escape(char.encode("ascii"))
+        variants = _ASCII_CASE_VARIANTS.get(char.lower())
+        if variants:
+            alternatives = b"|".join(re.escape(v.encode("utf-8")) for v in variants)
+            escaped = b"(?:" + escaped + b"|" + alternatives + b")"
+        parts.append(escaped)
+    return re.compile(b"".join(parts), re.IGNORECASE)
+
+
+def _file_may_match(file: Path, prefilter: re.Pattern[bytes]) -> bool:
+    """Search a file's raw bytes through mmap, without decoding it."""
+    try:
+        with open(file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return prefilter.search(b"") is not None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return prefilter.search(mapped) is not None
+    except (OSError, ValueError):
+        # Unmappable files (e.g. special files) take the decoding path.
+        return True
+
+
+def _scan_file(
+    file: Path,
+    regex: Any,
+    is_regex: bool,
+    limit: int,
+    prefilter: re.Pattern[bytes] | None = None,
+) -> list[dict[str, Any]]:
+    """Return up to ``limit`` matching lines from one file."""
+    # Most files don't contain a literal at all; checking the raw bytes first
+    # skips decoding and splitting them.
+    if prefilter is not None and not _file_may_match(file, prefilter):
+        return []
+
+    try:
+        content = file.read_text(encoding="utf-8", errors="ignore")
+    except (PermissionError, IsADirectoryError):
+        return []
+    
+    # A literal that occurs on some line also occurs in the whole file, so
+    # files without a hit skip the line split entirely. Regexes may use
+    # anchors that only match per line, so they always take the line scan.
+    if not is_regex and not regex.search(content):
+        return []
+    
+    matches = []
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        if regex.search(line):
+            matches.append({
+                "file": str(file),
+                "line_number": line_num,
+                "content": line.strip(),
+            })
+            if len(matches) >= limit:
+                break
+    return matches
+
+
 def _search_codebase(
     pattern: str,
     directory: str = ".",
@@ -610,62 +1040,59 @@ def _search_codebase(
     if not path.exists():
         raise FileNotFoundError(f"Directory not found: {directory}")
 
+    # Literal patterns are compiled too, so case-insensitive matching runs in
+    # the C regex engine instead of lowercasing every line.
+    flags = re.IGNORECASE if case_insensitive else 0
+    prefilter = None
     if is_regex:
-        flags = re.IGNORECASE if case_insensitive else 0
         try:
             regex = re.compile(pattern, flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
+        # re validates the pattern; RE2 (when usable) does the scanning so a
+        # pathological pattern can't backtrack exponentially on some line.
+        regex = _compile_linear_regex(pattern, case_insensitive) or regex
     else:
-        if case_insensitive:
-            pattern_lower = pattern.lower()
-    
-    results = []
+        regex = re.compile(re.escape(pattern), flags)
+        prefilter = _literal_prefilter(pattern, case_insensitive)
+        # Python's regex dialect differs from ripgrep's, so only literal
+        # searches are handed off.
+        if RIPGREP_PATH:
+            rg_results = _search_with_ripgrep(
+                RIPGREP_PATH, pattern, path, file_pattern, case_insensitive, result_limit
+            )
+            if rg_results is not None:
+                return rg_results
     
     # Get files to search
-    if file_pattern:
-        files = list(path.rglob(file_pattern))
+    if "/" in file_pattern:
+        # Path-shaped patterns need pathlib's glob semantics.
+        files = [
+            file for file in path.rglob(file_pattern)
+            # Skip excluded directories and binary files
+            if SEARCH_SKIP_DIRS.isdisjoint(file.parts)
+            and file.suffix.lower() not in SEARCH_SKIP_EXTENSIONS
+        ]
     else:
-        files = [f for f in path.rglob("*") if f.is_file()]
+        files = list(_iter_search_files(path, file_pattern))
     
-    # Skip common non-text files and directories
-    skip_dirs = {".git", ".venv", "__pycache__", "node_modules", ".mycelium/bin"}
-    skip_extensions = {".pyc", ".pyo", ".so", ".dylib", ".dll", ".exe", ".bin", ".jpg", ".png", ".gif", ".ico"}
+    results: list[dict[str, Any]] = []
+    if not files:
+        return results
     
-    for file in files:
-        # Skip excluded directories
-        if any(skip_dir in file.parts for skip_dir in skip_dirs):
-            continue
-        
-        # Skip binary files
-        if file.suffix.lower() in skip_extensions:
-            continue
-        
-        try:
-            content = file.read_text(encoding="utf-8", errors="ignore")
-        except (PermissionError, IsADirectoryError):
-            continue
-        
-        for line_num, line in enumerate(content.splitlines(), start=1):
-            matched = False
-            
-            if is_regex:
-                matched = bool(regex.search(line))
-            else:
-                if case_insensitive:
-                    matched = pattern_lower in line.lower()
-                else:
-                    matched = pattern in line
-            
-            if matched:
-                results.append({
-                    "file": str(file),
-                    "line_number": line_num,
-                    "content": line.strip(),
-                })
-                
-                if len(results) >= result_limit:
-                    return results
+    # Reads release the GIL, so a pool overlaps I/O across files. map() keeps
+    # results in file order, and pending scans are cancelled once the limit
+    # is reached.
+    executor = ThreadPoolExecutor(max_workers=min(SEARCH_MAX_WORKERS, len(files)))
+    try:
+        for file_matches in executor.map(
+            lambda file: _scan_file(file, regex, is_regex, result_limit, prefilter), files
+        ):
+            results.extend(file_matches)
+            if len(results) >= result_limit:
+                return results[:result_limit]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
     
     return results
 
@@ -720,18 +1147,25 @@ def list_files(directory: str, include_hidden: bool = False) -> list[dict[str, A
 
 
 @mcp.tool
-def read_file(file_path: str, encoding: str = "utf-8") -> str:
+def read_file(
+    file_path: str,
+    encoding: str = "utf-8",
+    offset: int = 0,
+    max_bytes: int | None = None,
+) -> str:
     """
-    Read contents of a file.
+    Read contents of a file, or a byte range of it.
     
     Args:
         file_path: Path to file to read.
         encoding: Character encoding to use (default: utf-8).
+        offset: Byte offset to start reading from (default: 0).
+        max_bytes: Maximum number of bytes to read, capped at 10 MB (default: rest of file).
         
     Returns:
         File contents as string.
     """
-    return _read_file(file_path, encoding)
+    return _read_file(file_path, encoding, offset, max_bytes)
 
 
 @mcp.tool
@@ -757,7 +1191,7 @@ def write_file(
 
 
 @mcp.tool
-def run_command(
+async def run_command(
     command: str,
     cwd: str = "",
     mission_path: str = "",
@@ -776,7 +1210,9 @@ def run_command(
     Returns:
         Dict with 'stdout', 'stderr', 'exit_code', and optional 'approval_required'.
     """
-    return _run_command(command, cwd, mission_path, timeout)
+    # Commands can run for up to `timeout` seconds; waiting on them in a
+    # worker thread keeps the server's event loop free for other tool calls.
+    return await asyncio.to_thread(_run_command, command, cwd, mission_path, timeout)
 
 
 @mcp.tool
@@ -849,7 +1285,7 @@ def prepare_extraction(
 
     try:
         with open(bundle_path) as f:
-            bundle = yaml.safe_load(f) or {}
+            bundle = yaml.load(f, Loader=_YAML_LOADER) or {}
     except Exception as e:
         return {"error": f"Failed to read bundle: {e}"}
 
@@ -941,13 +1377,20 @@ def submit_extraction(
     # Load existing bundle and replace claims
     try:
         with open(bundle_path) as f:
-            bundle = yaml.safe_load(f) or {}
+            bundle = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         bundle["claims"] = validated_claims
         bundle["extraction_method"] = "agent"
 
         with open(bundle_path, "w") as f:
-            yaml.safe_dump(bundle, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            yaml.dump(
+                bundle,
+                f,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
 
         return {
             "success": True,
@@ -11,44 +11,95 @@ Manages the execution of agents by:
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import math
 import os
+import pickle
+import re
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from mycelium.llm import DEFAULT_MODEL, CompletionResponse, complete
+from mycelium.llm import (
+    DEFAULT_MODEL,
+    CompletionResponse,
+    UsageMetadata,
+    complete,
+    preload_client,
+)
+from mycelium.progress_cache import (
+    ProgressDumper,
+    cache_progress,
+    invalidate_progress,
+    load_progress_cached,
+)
+
+try:
+    from mycelium.tools import (
+        TOOL_SCHEMAS,
+        execute_tool,
+        format_tool_result,
+        json_dumps,
+        json_loads,
+    )
+except ImportError as e:  # tolerate partial installs and import cycles
+    _TOOLS_IMPORT_ERROR: ImportError | None = e
+else:
+    _TOOLS_IMPORT_ERROR = None
 
 logger = logging.getLogger(__name__)
 
 # Agent roles that can be orchestrated
-VALID_AGENTS = {"scientist", "implementer", "verifier", "maintainer"}
+VALID_AGENTS = frozenset({"scientist", "implementer", "verifier", "maintainer"})
 
 # Agents that require HITL approval before execution
-REQUIRES_APPROVAL = {"implementer"}
+REQUIRES_APPROVAL = frozenset({"implementer"})
+
+# Tools that take auto_approve/mission_path from the running agent
+_GATED_TOOLS = frozenset({"write_file", "run_command"})
 
 # Routing labels and model defaults for bug-interrupt handoffs.
 DEEP_MODEL_LABEL = "model:deep"
 DEEP_MODEL_ENV_KEYS = ("MYCELIUM_MODEL_DEEP", "MYCELIUM_DEEP_MODEL")
 DEFAULT_DEEP_MODEL = "openai/gpt-5"
 
+# get_usage_summary() results, validated against (st_mtime_ns, st_size) the
+# same way as the shared progress cache.
+_USAGE_SUMMARY_CACHE: dict[str, tuple[int, int, bytes]] = {}
+_USAGE_SUMMARY_CACHE_MAXSIZE = 8
+
+
+# Repository roots found by find_repo_root, keyed by resolved start path.
+# Only hits are cached, and each is re-checked with one stat on use, so a
+# newly created or removed .mycelium directory is still noticed.
+_REPO_ROOT_CACHE: dict[str, str] = {}
+_REPO_ROOT_CACHE_MAXSIZE = 256
+
 
 def find_repo_root(start_path: Path | None = None) -> Path | None:
     """Find the repository root by looking for .mycelium directory."""
-    current = start_path or Path.cwd()
-    
     # Resolve to absolute path
-    current = current.resolve()
-    
+    start = str((start_path or Path.cwd()).resolve())
+
+    cached = _REPO_ROOT_CACHE.get(start)
+    if cached is not None and os.path.isdir(os.path.join(cached, ".mycelium")):
+        return Path(cached)
+
     # Check current and all parent directories
+    current = start
     while True:
-        if (current / ".mycelium").is_dir():
-            return current
-        parent = current.parent
+        if os.path.isdir(os.path.join(current, ".mycelium")):
+            if len(_REPO_ROOT_CACHE) >= _REPO_ROOT_CACHE_MAXSIZE:
+                _REPO_ROOT_CACHE.pop(next(iter(_REPO_ROOT_CACHE)))
+            _REPO_ROOT_CACHE[start] = current
+            return Path(current)
+        parent = os.path.dirname(current)
         if parent == current:
             # Reached filesystem root
             break
@@ -57,6 +108,13 @@ def find_repo_root(start_path: Path | None = None) -> Path | None:
     return None
 
 
+def resolve_progress_file(mission_path: Path) -> Path:
+    """Return the progress.yaml path for a mission directory or progress file."""
+    if mission_path.suffix == ".yaml":
+        return mission_path
+    return mission_path / "progress.yaml"
+
+
 def load_progress(mission_path: Path) -> dict[str, Any]:
     """
     Load progress.yaml from mission path.
@@ -72,44 +130,251 @@ def load_progress(mission_path: Path) -> dict[str, Any]:
         yaml.YAMLError: If YAML parsing fails.
         ValueError: If YAML root is not a mapping/object.
     """
-    if mission_path.suffix == ".yaml":
-        progress_file = mission_path
-    else:
-        progress_file = mission_path / "progress.yaml"
-    
-    if not progress_file.exists():
-        raise FileNotFoundError(f"progress.yaml not found at: {progress_file}")
-    
-    with open(progress_file) as f:
-        loaded = yaml.safe_load(f)
+    return load_progress_with_text(mission_path)[0]
+
+
+def load_progress_with_text(mission_path: Path) -> tuple[dict[str, Any], str]:
+    """
+    Load progress.yaml and also return its raw text.
+
+    The raw text lets prompt building splice the file in verbatim instead of
+    re-serializing the parsed dict.
+
+    Args:
+        mission_path: Path to mission directory or progress.yaml file.
+
+    Returns:
+        Tuple of (parsed YAML content as dict, raw file text).
+
+    Raises:
+        Same as load_progress.
+    """
+    progress_file = resolve_progress_file(mission_path)
+
+    try:
+        loaded, raw_text = load_progress_cached(progress_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"progress.yaml not found at: {progress_file}") from None
 
     # Empty YAML is valid; treat it as an empty progress object.
     if loaded is None:
-        return {}
+        loaded = {}
 
     if not isinstance(loaded, dict):
         raise ValueError(
             f"Invalid progress.yaml format at {progress_file}: expected YAML mapping/object root"
         )
 
-    return loaded
+    return loaded, raw_text
+
+
+# Placeholder dumped in place of llm_usage.runs so the pre-formatted run
+# entries can be spliced into the generic YAML output.
+_RUNS_PLACEHOLDER = "__mycelium_llm_usage_runs__"
+_RUNS_PLACEHOLDER_RE = re.compile(rf"^( *)runs: {_RUNS_PLACEHOLDER}$", re.MULTILINE)
+
+# Strings that can be emitted as plain YAML scalars without being resolved
+# to another type on load.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_YAML_RESERVED_WORDS = frozenset(
+    {"true", "false", "yes", "no", "on", "off", "null"}
+)
+
+
+def _emit_yaml_scalar(value: Any) -> str | None:
+    """Format a run-entry value as a YAML scalar, or None if unsupported."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is float:
+        if not math.isfinite(value):
+            return None
+        # Mirror SafeRepresenter.represent_float: YAML 1.1 floats need a dot.
+        text = repr(value).lower()
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if type(value) is str:
+        if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+            return value
+        if value.isprintable():
+            return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def _emit_run_entry_yaml(run: Any, indent: str) -> str:
+    """Format one llm_usage run entry as a YAML block sequence item.
+
+    Run entries have a fixed schema of short strings, ints, a float and a
+    bool, so they are formatted directly; anything else goes through the
+    generic dumper.
+    """
+    if isinstance(run, dict) and run:
+        lines = []
+        for key, value in run.items():
+            scalar = _emit_yaml_scalar(value)
+            if scalar is None or not isinstance(key, str) or _emit_yaml_scalar(key) != key:
+                break
+            prefix = "- " if not lines else "  "
+            lines.append(f"{indent}{prefix}{key}: {scalar}\n")
+        else:
+            return "".join(lines)
+
+    generic = yaml.dump(
+        [run],
+        Dumper=ProgressDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    return "".join(
+        f"{indent}{line}" if line != "\n" else line
+        for line in generic.splitlines(keepends=True)
+    )
+
+
+def _dump_progress_yaml(progress: dict[str, Any]) -> str:
+    """Serialize progress, formatting llm_usage.runs with the fast emitter."""
+    llm_usage = progress.get("llm_usage")
+    runs = llm_usage.get("runs") if isinstance(llm_usage, dict) else None
+
+    if isinstance(runs, list) and runs:
+        to_dump = {**progress, "llm_usage": {**llm_usage, "runs": _RUNS_PLACEHOLDER}}
+    else:
+        to_dump = progress
+
+    content = yaml.dump(
+        to_dump,
+        Dumper=ProgressDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    if to_dump is progress:
+        return content
+
+    matches = list(_RUNS_PLACEHOLDER_RE.finditer(content))
+    if len(matches) != 1 or content.count(_RUNS_PLACEHOLDER) != 1:
+        # The placeholder collided with user content; use the generic path.
+        return yaml.dump(
+            progress,
+            Dumper=ProgressDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+
+    match = matches[0]
+    indent = match.group(1)
+    runs_block = "".join(_emit_run_entry_yaml(run, indent) for run in runs)
+    return f"{content[:match.start()]}{indent}runs:\n{runs_block}{content[match.end() + 1:]}"
+
+
+_LLM_USAGE_KEY_RE = re.compile(r"^llm_usage:\n", re.MULTILINE)
+
+
+def _emit_llm_usage_yaml(llm_usage: Any) -> str | None:
+    """Format a top-level llm_usage block as _dump_progress_yaml would.
+
+    Returns None when the block holds anything other than a runs list and
+    scalar totals, so callers can fall back to a full dump.
+    """
+    if not isinstance(llm_usage, dict) or not llm_usage:
+        return None
+    parts = ["llm_usage:\n"]
+    for key, value in llm_usage.items():
+        if not isinstance(key, str) or _emit_yaml_scalar(key) != key:
+            return None
+        if key == "runs" and isinstance(value, list):
+            if not value:
+                parts.append("  runs: []\n")
+                continue
+            parts.append("  runs:\n")
+            parts.extend(_emit_run_entry_yaml(run, "  ") for run in value)
+            continue
+        scalar = _emit_yaml_scalar(value)
+        if scalar is None:
+            return None
+        parts.append(f"  {key}: {scalar}\n")
+    return "".join(parts)
+
 
+def _splice_llm_usage(
+    raw_text: str,
+    old_usage: Any,
+    new_usage: dict[str, Any],
+) -> str | None:
+    """Replace the llm_usage block in raw progress.yaml text.
 
-def save_progress(mission_path: Path, progress: dict[str, Any]) -> None:
+    Only the usage block changes when a run is logged, so re-emitting just
+    that block avoids dumping the whole tree. The splice is used only when
+    the existing block is byte-identical to what the emitter produces for
+    old_usage; hand-edited or unexpected layouts return None.
+    """
+    matches = list(_LLM_USAGE_KEY_RE.finditer(raw_text))
+    if len(matches) != 1:
+        return None
+    old_block = _emit_llm_usage_yaml(old_usage)
+    new_block = _emit_llm_usage_yaml(new_usage)
+    if old_block is None or new_block is None:
+        return None
+
+    start = matches[0].start()
+    end = start + len(old_block)
+    if raw_text[start:end] != old_block or raw_text[end:end + 1] in (" ", "-", "\t"):
+        return None
+    return f"{raw_text[:start]}{new_block}{raw_text[end:]}"
+
+
+def save_progress(
+    mission_path: Path,
+    progress: dict[str, Any],
+    content: str | None = None,
+) -> None:
     """
     Save progress.yaml to mission path.
     
     Args:
         mission_path: Path to mission directory or progress.yaml file.
         progress: Progress data to save.
+        content: YAML text already known to represent progress. When
+            omitted, progress is serialized here.
     """
-    if mission_path.suffix == ".yaml":
-        progress_file = mission_path
-    else:
-        progress_file = mission_path / "progress.yaml"
-    
-    with open(progress_file, "w") as f:
-        yaml.safe_dump(progress, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    from mycelium.atomic_write import atomic_write_text
+
+    progress_file = resolve_progress_file(mission_path)
+
+    # Serialize to one buffer so the file is written with a single write +
+    # fsync, and readers never observe a partially written progress.yaml.
+    if content is None:
+        content = _dump_progress_yaml(progress)
+
+    invalidate_progress(progress_file)
+    atomic_write_text(progress_file, content, mkdir=False, preserve_mode=True)
+    cache_progress(progress_file, progress, content)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """Read a text file, memoized on (path, mtime_ns).
+
+    Callers pass the current ``st_mtime_ns`` so an edited file misses the
+    cache and is re-read.
+    """
+    return Path(path).read_text()
+
+
+@functools.lru_cache(maxsize=32)
+def _template_paths(repo_root: Path) -> dict[str, str]:
+    """Map each agent role, plus "contract", to its file path under repo_root."""
+    mycelium_dir = repo_root / ".mycelium"
+    paths = {
+        role: str(mycelium_dir / "agents" / "mission" / f"{role}.md")
+        for role in VALID_AGENTS
+    }
+    paths["contract"] = str(mycelium_dir / "CONTRACT.md")
+    return paths
 
 
 def get_agent_template(repo_root: Path, agent_role: str) -> str:
@@ -123,22 +388,48 @@ def get_agent_template(repo_root: Path, agent_role: str) -> str:
     Returns:
         Content of agent template file.
     """
-    template_path = repo_root / ".mycelium" / "agents" / "mission" / f"{agent_role}.md"
-    
-    if not template_path.exists():
-        raise FileNotFoundError(f"Agent template not found: {template_path}")
-    
-    return template_path.read_text()
+    template_path = _template_paths(repo_root).get(agent_role)
+    if template_path is None:
+        template_path = str(repo_root / ".mycelium" / "agents" / "mission" / f"{agent_role}.md")
+
+    try:
+        mtime_ns = os.stat(template_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Agent template not found: {template_path}") from None
+
+    return _read_text_cached(template_path, mtime_ns)
 
 
 def get_contract(repo_root: Path) -> str:
     """Load CONTRACT.md content."""
-    contract_path = repo_root / ".mycelium" / "CONTRACT.md"
-    
-    if not contract_path.exists():
-        raise FileNotFoundError(f"CONTRACT.md not found: {contract_path}")
-    
-    return contract_path.read_text()
+    contract_path = _template_paths(repo_root)["contract"]
+
+    try:
+        mtime_ns = os.stat(contract_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CONTRACT.md not found: {contract_path}") from None
+
+    return _read_text_cached(contract_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _system_prompt_prefix(agent_role: str, contract: str, agent_template: str) -> str:
+    """Compose the static head of an agent's system prompt.
+
+    contract and agent_template come from _read_text_cached, so repeated
+    calls pass the same string objects and the lookup stays cheap.
+    """
+    return f"""You are the {agent_role} agent in the Mycelium multi-agent workflow.
+
+## CONTRACT.md
+{contract}
+
+## Agent Instructions ({agent_role}.md)
+{agent_template}
+
+## Current Mission Progress (progress.yaml)
+```yaml
+"""
 
 
 def build_agent_prompt(
@@ -146,6 +437,7 @@ def build_agent_prompt(
     mission_path: Path,
     progress: dict[str, Any],
     agent_role: str,
+    progress_yaml: str | None = None,
 ) -> list[dict[str, str]]:
     """
     Build the prompt messages for an agent call.
@@ -155,6 +447,8 @@ def build_agent_prompt(
         mission_path: Path to mission directory.
         progress: Loaded progress.yaml content.
         agent_role: Current agent role.
+        progress_yaml: Raw progress.yaml text to inline. When omitted,
+            progress is serialized the same way save_progress writes it.
         
     Returns:
         List of message dicts for LLM completion.
@@ -162,21 +456,14 @@ def build_agent_prompt(
     contract = get_contract(repo_root)
     agent_template = get_agent_template(repo_root, agent_role)
     
-    # Format progress.yaml as YAML for context
-    progress_yaml = yaml.safe_dump(progress, default_flow_style=False, allow_unicode=True)
+    # Format progress.yaml as YAML for context, exactly as save_progress would
+    # write it so the agent sees the same layout it is asked to edit.
+    if progress_yaml is None:
+        progress_yaml = _dump_progress_yaml(progress)
+    progress_yaml = progress_yaml.rstrip("\n") + "\n"
     
     # Build system message with full context
-    system_content = f"""You are the {agent_role} agent in the Mycelium multi-agent workflow.
-
-## CONTRACT.md
-{contract}
-
-## Agent Instructions ({agent_role}.md)
-{agent_template}
-
-## Current Mission Progress (progress.yaml)
-```yaml
-{progress_yaml}
+    system_content = f"""{_system_prompt_prefix(agent_role, contract, agent_template)}{progress_yaml}
 ```
 
 ## Mission Path
@@ -351,6 +638,26 @@ def _coerce_non_negative_float(value: Any) -> float:
     return float(parsed)
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent _utc_timestamp call.
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ISO-8601 form with microseconds.
+
+    The date/time prefix is formatted once per second; later calls within
+    the same second only append the microseconds.
+    """
+    global _timestamp_prefix
+    now_ns = time.time_ns()
+    seconds, remainder_ns = divmod(now_ns, 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if cached_seconds != seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{remainder_ns // 1000:06d}+00:00"
+
+
 def append_llm_usage(
     progress: dict[str, Any],
     agent_role: str,
@@ -372,28 +679,34 @@ def append_llm_usage(
         llm_usage_raw = {}
 
     runs_raw = llm_usage_raw.get("runs")
-    runs: list[dict[str, Any]]
+    runs: list[dict[str, Any]] = []
+    total_tokens = 0
+    total_cost_usd = 0.0
     if isinstance(runs_raw, list):
-        runs = [run for run in runs_raw if isinstance(run, dict)]
-    else:
-        runs = []
+        # Re-total while filtering: stored totals go stale whenever runs are
+        # edited by hand or by an agent, and this pass is needed anyway.
+        for run in runs_raw:
+            if isinstance(run, dict):
+                runs.append(run)
+                total_tokens += _coerce_non_negative_int(run.get("total_tokens", 0))
+                total_cost_usd += _coerce_non_negative_float(run.get("cost_usd", 0.0))
 
     llm_usage: dict[str, Any] = {
         "runs": runs,
-        "total_tokens": 0,
-        "total_cost_usd": 0.0,
+        "total_tokens": total_tokens,
+        "total_cost_usd": total_cost_usd,
     }
     progress["llm_usage"] = llm_usage
     
     # Create run entry
-    run_entry = {
+    run_entry: dict[str, Any] = {
         "agent_role": agent_role,
         "model": response.usage.model,
         "prompt_tokens": _coerce_non_negative_int(response.usage.prompt_tokens),
         "completion_tokens": _coerce_non_negative_int(response.usage.completion_tokens),
         "total_tokens": _coerce_non_negative_int(response.usage.total_tokens),
         "cost_usd": round(_coerce_non_negative_float(response.usage.cost_usd), 6),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
         "success": response.success,
     }
     
@@ -404,17 +717,8 @@ def append_llm_usage(
     llm_usage["runs"].append(run_entry)
     
     # Update totals
-    llm_usage["total_tokens"] = sum(
-        _coerce_non_negative_int(r.get("total_tokens", 0))
-        for r in llm_usage["runs"]
-    )
-    llm_usage["total_cost_usd"] = round(
-        sum(
-            _coerce_non_negative_float(r.get("cost_usd", 0.0))
-            for r in llm_usage["runs"]
-        ),
-        6,
-    )
+    llm_usage["total_tokens"] += run_entry["total_tokens"]
+    llm_usage["total_cost_usd"] = round(llm_usage["total_cost_usd"] + run_entry["cost_usd"], 6)
     
     return progress
 
@@ -437,6 +741,10 @@ def check_hitl_approval(agent_role: str, auto_approve: bool = False) -> bool:
         logger.info(f"Auto-approval enabled for {agent_role}")
         return True
     
+    # The LLM call only starts once approved, but the client import can
+    # overlap with the time spent reading the prompt.
+    preload_client()
+
     # Interactive confirmation
     print(f"\n⚠️  HUMAN-IN-THE-LOOP APPROVAL REQUIRED")
     print(f"Agent '{agent_role}' may modify source code.")
@@ -470,12 +778,13 @@ def run_agent(
     Returns:
         CompletionResponse with agent output.
     """
-    import json
-    
     mission_path = Path(mission_path)
+    # Resolve progress.yaml once; its parent is the mission directory either
+    # way, so the repo-root walk needs no is_dir() stat.
+    progress_file = resolve_progress_file(mission_path)
     
     # Find repo root
-    repo_root = find_repo_root(mission_path if mission_path.is_dir() else mission_path.parent)
+    repo_root = find_repo_root(progress_file.parent)
     if not repo_root:
         return CompletionResponse(
             success=False,
@@ -484,7 +793,7 @@ def run_agent(
     
     # Load progress
     try:
-        progress = load_progress(mission_path)
+        progress, progress_yaml = load_progress_with_text(progress_file)
     except FileNotFoundError as e:
         return CompletionResponse(success=False, error=str(e))
     except yaml.YAMLError as e:
@@ -504,12 +813,14 @@ def run_agent(
     if current_agent not in VALID_AGENTS:
         return CompletionResponse(
             success=False,
-            error=f"Invalid current_agent: '{current_agent}'. Valid: {VALID_AGENTS}",
+            error=f"Invalid current_agent: '{current_agent}'. Valid: {sorted(VALID_AGENTS)}",
         )
     
     # Build prompt
     try:
-        messages = build_agent_prompt(repo_root, mission_path, progress, current_agent)
+        messages = build_agent_prompt(
+            repo_root, mission_path, progress, current_agent, progress_yaml
+        )
     except FileNotFoundError as e:
         return CompletionResponse(success=False, error=str(e))
     
@@ -534,12 +845,11 @@ def run_agent(
     # Get tools if enabled
     tools = None
     if enable_tools:
-        try:
-            from mycelium.tools import TOOL_SCHEMAS, execute_tool, format_tool_result
+        if _TOOLS_IMPORT_ERROR is None:
             tools = TOOL_SCHEMAS
             logger.info(f"Tools enabled: {len(tools)} tools available")
-        except ImportError as e:
-            logger.warning(f"Could not import tools module: {e}")
+        else:
+            logger.warning(f"Could not import tools module: {_TOOLS_IMPORT_ERROR}")
     
     logger.info(
         "Running %s agent with model %s (source=%s)",
@@ -548,10 +858,15 @@ def run_agent(
         model_source,
     )
     
-    # Tool execution loop
+    # Tool execution loop. The system and user messages built above are
+    # never rebuilt or edited here; the loop only appends. That keeps the
+    # progress snapshot serialized exactly once per run and leaves the prompt
+    # prefix byte-stable, which provider-side prompt caching relies on.
     max_tool_iterations = 20
-    total_usage = None
+    total_usage = UsageMetadata()
     final_content = ""
+    append_message = messages.append
+    mission_path_str = str(mission_path)
     
     for iteration in range(max_tool_iterations):
         response = complete(
@@ -561,19 +876,13 @@ def run_agent(
             tools=tools,
         )
         
-        # Accumulate usage
-        if total_usage is None:
-            total_usage = response.usage
-        else:
-            # Add usage from this iteration
-            from mycelium.llm import UsageMetadata
-            total_usage = UsageMetadata(
-                prompt_tokens=total_usage.prompt_tokens + response.usage.prompt_tokens,
-                completion_tokens=total_usage.completion_tokens + response.usage.completion_tokens,
-                total_tokens=total_usage.total_tokens + response.usage.total_tokens,
-                cost_usd=total_usage.cost_usd + response.usage.cost_usd,
-                model=response.usage.model,
-            )
+        # Accumulate usage in place
+        usage = response.usage
+        total_usage.prompt_tokens += usage.prompt_tokens
+        total_usage.completion_tokens += usage.completion_tokens
+        total_usage.total_tokens += usage.total_tokens
+        total_usage.cost_usd += usage.cost_usd
+        total_usage.model = usage.model
         
         if not response.success:
             # Return failure immediately
@@ -581,19 +890,20 @@ def run_agent(
             return response
         
         # If no tool calls, we're done
-        if not response.tool_calls:
+        tool_calls = response.tool_calls
+        if not tool_calls:
             final_content = response.content
             logger.info(f"Agent completed after {iteration + 1} iteration(s)")
             break
         
         # Execute tool calls and add results to messages
-        logger.info(f"Executing {len(response.tool_calls)} tool call(s) in iteration {iteration + 1}")
+        logger.info(f"Executing {len(tool_calls)} tool call(s) in iteration {iteration + 1}")
         
-        # Add assistant message with tool calls
-        assistant_message = {"role": "assistant", "content": response.content or ""}
-        if response.tool_calls:
-            # Format for LLM context
-            assistant_message["tool_calls"] = [
+        # Add assistant message with tool calls, formatted for LLM context
+        append_message({
+            "role": "assistant",
+            "content": response.content or "",
+            "tool_calls": [
                 {
                     "id": tc["id"],
                     "type": "function",
@@ -602,37 +912,38 @@ def run_agent(
                         "arguments": tc["arguments"],
                     },
                 }
-                for tc in response.tool_calls
-            ]
-        messages.append(assistant_message)
+                for tc in tool_calls
+            ],
+        })
         
         # Execute each tool and add results
-        for tool_call in response.tool_calls:
+        for tool_call in tool_calls:
             tool_name = tool_call["name"]
             try:
-                arguments = json.loads(tool_call["arguments"])
+                arguments = json_loads(tool_call["arguments"])
             except json.JSONDecodeError as e:
                 tool_result = {"error": f"Invalid JSON arguments: {e}"}
                 logger.error(f"Failed to parse tool arguments: {e}")
             else:
                 try:
-                    # Inject auto_approve for write_file and run_command
-                    if tool_name in ("write_file", "run_command") and auto_approve:
-                        arguments["auto_approve"] = True
-                    if tool_name in ("write_file", "run_command") and "mission_path" not in arguments:
-                        arguments["mission_path"] = str(mission_path)
+                    if tool_name in _GATED_TOOLS:
+                        # Inject auto_approve and mission_path for gated tools
+                        if auto_approve:
+                            arguments["auto_approve"] = True
+                        if "mission_path" not in arguments:
+                            arguments["mission_path"] = mission_path_str
                     
                     result = execute_tool(tool_name, arguments)
                     tool_result = format_tool_result(tool_name, result)
                 except Exception as e:
-                    tool_result = json.dumps({"error": str(e)})
+                    tool_result = json_dumps({"error": str(e)})
                     logger.error(f"Tool {tool_name} failed: {e}")
             
             # Add tool result message
-            messages.append({
+            append_message({
                 "role": "tool",
                 "tool_call_id": tool_call["id"],
-                "content": tool_result if isinstance(tool_result, str) else json.dumps(tool_result),
+                "content": tool_result if isinstance(tool_result, str) else json_dumps(tool_result),
             })
         
         # If we've hit the limit, break with warning (success=False for safety)
@@ -657,16 +968,22 @@ def run_agent(
     # Log usage to progress.yaml
     # RELOAD from disk first to capture changes made by tool execution
     try:
-        progress = load_progress(mission_path)
+        progress, progress_yaml = load_progress_with_text(progress_file)
     except Exception as e:
         logger.warning(f"Could not reload progress.yaml to save usage: {e}")
         # Proceed with in-memory progress (better than nothing), though stale
-        
+        progress_yaml = None
+    
+    previous_usage = progress.get("llm_usage")
     progress = append_llm_usage(progress, current_agent, final_response)
     
-    # Save updated progress
+    # Save updated progress, rewriting only the llm_usage block when the
+    # file is in the layout save_progress produces.
+    content = None
+    if progress_yaml is not None:
+        content = _splice_llm_usage(progress_yaml, previous_usage, progress["llm_usage"])
     try:
-        save_progress(mission_path, progress)
+        save_progress(progress_file, progress, content)
         logger.info(f"Updated progress.yaml with LLM usage")
     except Exception as e:
         logger.error(f"Failed to save progress: {e}")
@@ -674,12 +991,7 @@ def run_agent(
         if final_response.error:
             final_response.error += f"; Failed to save progress: {e}"
         else:
-            final_response = CompletionResponse(
-                content=final_response.content,
-                usage=final_response.usage,
-                success=final_response.success,
-                error=f"Warning: Failed to save progress: {e}",
-            )
+            final_response.error = f"Warning: Failed to save progress: {e}"
     
     return final_response
 
@@ -694,13 +1006,49 @@ def get_usage_summary(mission_path: str | Path) -> dict[str, Any]:
     Returns:
         Dict with usage summary (total_tokens, total_cost_usd, runs count).
     """
-    mission_path = Path(mission_path)
-    
+    progress_file = resolve_progress_file(Path(mission_path))
+
+    # Polling callers (status dashboards) mostly see an unchanged file, so
+    # reuse the summary instead of copying and re-normalizing every run.
+    try:
+        stat = progress_file.stat()
+    except OSError:
+        stat = None
+    cache_key = str(progress_file)
+    cached = _USAGE_SUMMARY_CACHE.get(cache_key)
+    if (
+        stat is not None
+        and cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return pickle.loads(cached[2])
+
     try:
-        progress = load_progress(mission_path)
+        progress = load_progress(progress_file)
     except (FileNotFoundError, yaml.YAMLError, ValueError):
         return {"total_tokens": 0, "total_cost_usd": 0.0, "runs": 0, "runs_detail": []}
     
+    summary = summarize_usage(progress)
+    if stat is not None:
+        if cache_key not in _USAGE_SUMMARY_CACHE and len(_USAGE_SUMMARY_CACHE) >= _USAGE_SUMMARY_CACHE_MAXSIZE:
+            _USAGE_SUMMARY_CACHE.pop(next(iter(_USAGE_SUMMARY_CACHE)))
+        _USAGE_SUMMARY_CACHE[cache_key] = (
+            stat.st_mtime_ns, stat.st_size, pickle.dumps(summary, pickle.HIGHEST_PROTOCOL)
+        )
+    return summary
+
+
+def summarize_usage(progress: dict[str, Any]) -> dict[str, Any]:
+    """
+    Summarize LLM usage from an already-loaded progress dict.
+    
+    Args:
+        progress: Parsed progress.yaml content.
+        
+    Returns:
+        Dict with usage summary, in the same shape as get_usage_summary().
+    """
     llm_usage_raw = progress.get("llm_usage")
     llm_usage: dict[str, Any] = llm_usage_raw if isinstance(llm_usage_raw, dict) else {}
     runs_raw = llm_usage.get("runs", [])
@@ -0,0 +1,103 @@
+"""Shared parse cache for mission progress.yaml files.
+
+The orchestrator and the MCP server both re-read progress.yaml on every
+agent step or tool call. They share this one cache, so a write through
+either side replaces the entry the other would otherwise serve.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as ProgressDumper
+    from yaml import CSafeLoader as ProgressLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as ProgressDumper
+    from yaml import SafeLoader as ProgressLoader
+
+__all__ = [
+    "ProgressDumper",
+    "ProgressLoader",
+    "cache_progress",
+    "invalidate_progress",
+    "load_progress_cached",
+]
+
+# Pickled progress.yaml contents and raw text keyed by file path, in LRU
+# order. Entries are validated against (st_mtime_ns, st_size) so edits made
+# by tools or other processes are picked up on the next load. Unpickling a
+# snapshot is several times cheaper than deepcopying the parsed dict and
+# still hands every caller an independent copy.
+_PROGRESS_CACHE: dict[str, tuple[int, int, bytes, str]] = {}
+_PROGRESS_CACHE_MAXSIZE = 8
+
+
+def _cache_key(progress_file: Path) -> str:
+    """Key a path so relative and absolute spellings share one entry."""
+    return os.path.abspath(progress_file)
+
+
+def _store(cache_key: str, entry: tuple[int, int, bytes, str]) -> None:
+    """Store an entry as most recently used, evicting the LRU one."""
+    _PROGRESS_CACHE.pop(cache_key, None)
+    if len(_PROGRESS_CACHE) >= _PROGRESS_CACHE_MAXSIZE:
+        # Dicts preserve insertion order, so the first key is least recently used.
+        _PROGRESS_CACHE.pop(next(iter(_PROGRESS_CACHE)))
+    _PROGRESS_CACHE[cache_key] = entry
+
+
+def load_progress_cached(progress_file: Path) -> tuple[Any, str]:
+    """
+    Parse progress_file, reusing the last parse while the file is unchanged.
+
+    Returns:
+        Tuple of (parsed YAML, raw file text). The parsed value is a copy the
+        caller may mutate; it is whatever the YAML root is (None for an empty
+        file), so callers validate its shape themselves.
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the file cannot be parsed.
+    """
+    stat = progress_file.stat()
+    cache_key = _cache_key(progress_file)
+    cached = _PROGRESS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        # Mark as most recently used so active missions aren't evicted first.
+        _PROGRESS_CACHE[cache_key] = _PROGRESS_CACHE.pop(cache_key)
+        return pickle.loads(cached[2]), cached[3]
+
+    raw_text = progress_file.read_text()
+    loaded = yaml.load(raw_text, Loader=ProgressLoader)
+    _store(
+        cache_key,
+        (stat.st_mtime_ns, stat.st_size, pickle.dumps(loaded, pickle.HIGHEST_PROTOCOL), raw_text),
+    )
+    return loaded, raw_text
+
+
+def cache_progress(progress_file: Path, progress: Any, raw_text: str) -> None:
+    """
+    Seed the cache with content just written to progress_file.
+
+    Writers chain save -> load on the same file, so this lets the next load
+    skip the re-parse. Unpicklable content is simply not cached.
+    """
+    try:
+        stat = progress_file.stat()
+        snapshot = pickle.dumps(progress, pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        invalidate_progress(progress_file)
+        return
+    _store(_cache_key(progress_file), (stat.st_mtime_ns, stat.st_size, snapshot, raw_text))
+
+
+def invalidate_progress(progress_file: Path) -> None:
+    """Drop any cached parse of progress_file."""
+    _PROGRESS_CACHE.pop(_cache_key(progress_file), None)
@@ -9,10 +9,36 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional: pip install 'mycelium[json]'
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# String tool results longer than this are truncated before reaching the LLM.
+TOOL_RESULT_MAX_CHARS = 10000
+
+
+def json_dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize tool payloads to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; stdlib json handles these.
+            pass
+    return json.dumps(obj, default=default)
+
+
+def json_loads(text: str | bytes) -> Any:
+    """Parse tool-call arguments. Errors are json.JSONDecodeError either way."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 # =============================================================================
 # Tool Schemas (OpenAI-compatible format)
@@ -98,7 +124,7 @@ TOOL_SCHEMAS: list[dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "read_file",
-            "description": "Read contents of a file.",
+            "description": "Read contents of a file, or a byte range of it via offset/max_bytes.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -111,6 +137,15 @@ TOOL_SCHEMAS: list[dict[str, Any]] = [
                         "description": "Character encoding to use. Default: utf-8.",
                         "default": "utf-8",
                     },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Byte offset to start reading from. Default: 0.",
+                        "default": 0,
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Maximum number of bytes to read. Capped at 10 MB. Default: rest of the file (up to 10 MB).",
+                    },
                 },
                 "required": ["file_path"],
             },
@@ -238,6 +273,40 @@ TOOL_SCHEMAS: list[dict[str, Any]] = [
 # Helper Functions
 # =============================================================================
 
+_TOOL_SCHEMA_BY_NAME: dict[str, dict[str, Any]] = {
+    tool["function"]["name"]: tool for tool in TOOL_SCHEMAS
+}
+
+# Tool implementations keyed by name. Filled on first use so importing this
+# module doesn't import the MCP server (and FastMCP) up front.
+_TOOL_MAP: dict[str, Callable[..., Any]] = {}
+
+
+def _ensure_tool_map() -> dict[str, Callable[..., Any]]:
+    """Import the tool implementations from mcp.server once and map them by name."""
+    if not _TOOL_MAP:
+        from mycelium.mcp.server import (
+            _list_files,
+            _read_file,
+            _read_progress,
+            _run_command,
+            _search_codebase,
+            _update_progress,
+            _write_file,
+        )
+
+        _TOOL_MAP.update({
+            "read_progress": _read_progress,
+            "update_progress": _update_progress,
+            "list_files": _list_files,
+            "read_file": _read_file,
+            "write_file": _write_file,
+            "run_command": _run_command,
+            "search_codebase": _search_codebase,
+        })
+    return _TOOL_MAP
+
+
 def get_tool_by_name(name: str) -> dict[str, Any] | None:
     """
     Get a tool schema by name.
@@ -248,10 +317,7 @@ def get_tool_by_name(name: str) -> dict[str, Any] | None:
     Returns:
         Tool schema dict, or None if not found.
     """
-    for tool in TOOL_SCHEMAS:
-        if tool.get("function", {}).get("name") == name:
-            return tool
-    return None
+    return _TOOL_SCHEMA_BY_NAME.get(name)
 
 
 def get_tool_names() -> list[str]:
@@ -273,35 +339,18 @@ def execute_tool(name: str, arguments: dict[str, Any]) -> Any:
     Raises:
         ValueError: If tool name is unknown.
     """
-    # Import tool implementations from mcp.server
-    from mycelium.mcp.server import (
-        _list_files,
-        _read_file,
-        _read_progress,
-        _run_command,
-        _search_codebase,
-        _update_progress,
-        _write_file,
-    )
-    
-    # Map tool names to their implementations
-    tool_map = {
-        "read_progress": _read_progress,
-        "update_progress": _update_progress,
-        "list_files": _list_files,
-        "read_file": _read_file,
-        "write_file": _write_file,
-        "run_command": _run_command,
-        "search_codebase": _search_codebase,
-    }
-    
-    if name not in tool_map:
-        raise ValueError(f"Unknown tool: {name}. Available tools: {list(tool_map.keys())}")
+    tool_map = _ensure_tool_map()
+    try:
+        tool = tool_map[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown tool: {name}. Available tools: {list(tool_map.keys())}"
+        ) from None
     
     logger.info(f"Executing tool: {name} with args: {list(arguments.keys())}")
     
     try:
-        result = tool_map[name](**arguments)
+        result = tool(**arguments)
         logger.debug(f"Tool {name} completed successfully")
         return result
     except Exception as e:
@@ -309,27 +358,34 @@ def execute_tool(name: str, arguments: dict[str, Any]) -> Any:
         raise
 
 
-def format_tool_result(tool_name: str, result: Any) -> str:
+def format_tool_result(
+    tool_name: str,
+    result: Any,
+    max_length: int = TOOL_RESULT_MAX_CHARS,
+) -> str:
     """
     Format a tool result for inclusion in LLM messages.
     
     Args:
         tool_name: Name of the tool that produced the result.
         result: Raw result from tool execution.
+        max_length: Longest string result passed through untruncated.
         
     Returns:
         JSON string representation of the result.
     """
     if isinstance(result, str):
-        # For string results (like file contents), truncate if too long
-        if len(result) > 10000:
-            return json.dumps({
-                "content": result[:10000],
+        # For string results (like file contents), truncate if too long.
+        # Only the bounded prefix is handed to the encoder.
+        total_length = len(result)
+        if total_length > max_length:
+            return json_dumps({
+                "content": result[:max_length],
                 "truncated": True,
-                "total_length": len(result),
+                "total_length": total_length,
             })
-        return json.dumps({"content": result})
+        return json_dumps({"content": result})
     elif isinstance(result, (dict, list)):
-        return json.dumps(result, default=str)
+        return json_dumps(result, default=str)
     else:
-        return json.dumps({"result": str(result)})
+        return json_dumps({"result": str(result)})
@@ -0,0 +1,10 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import os
+
+# LiteLLM fetches its model cost map over the network on first import and
+# retries in a background thread when that fails. Tests must not depend on
+# the network, so pin it to the bundled copy.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
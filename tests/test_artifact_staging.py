@@ -100,6 +100,24 @@ class TestAtomicWrite:
         atomic_write_text(target, "café ñ")
         assert target.read_text(encoding="utf-8") == "café ñ"
 
+    def test_atomic_write_text_preserve_mode(self, tmp_path: Path):
+        target = tmp_path / "mode.txt"
+        target.write_text("old")
+        os.chmod(target, 0o640)
+        atomic_write_text(target, "new", preserve_mode=True)
+        assert target.read_text() == "new"
+        assert target.stat().st_mode & 0o777 == 0o640
+
+    def test_atomic_write_text_preserve_mode_new_file(self, tmp_path: Path):
+        target = tmp_path / "fresh.txt"
+        old_umask = os.umask(0o027)
+        try:
+            atomic_write_text(target, "hello", preserve_mode=True)
+        finally:
+            os.umask(old_umask)
+        assert target.read_text() == "hello"
+        assert target.stat().st_mode & 0o777 == 0o640
+
 
 # ── AC-1: All outputs staged in Draft Scope ──────────────────────────
 
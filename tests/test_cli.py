@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import os
 from argparse import Namespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from mycelium.cli import _resolve_auto_config
+from mycelium.cli import (
+    _SUBCOMMAND_BUILDERS,
+    _requested_command,
+    _resolve_auto_config,
+    cmd_auto,
+    cmd_run,
+    cmd_status,
+    main,
+)
+from mycelium.llm import CompletionResponse, UsageMetadata
+from mycelium.orchestrator import load_progress, load_progress_with_text
 
 
 def _auto_args(
@@ -69,3 +80,209 @@ class TestResolveAutoConfig:
             _, _, _, auto_approve = _resolve_auto_config(_auto_args(approve=True))
 
         assert auto_approve is True
+
+
+class TestCmdStatus:
+    """Tests for status command output."""
+
+    def test_long_objective_is_wrapped(self, tmp_path, capsys):
+        """Long objectives wrap at 70 columns with a two-space indent."""
+        objective = " ".join(["objective"] * 20)
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        (mission_dir / "progress.yaml").write_text(
+            "current_agent: scientist\n"
+            f"mission_context:\n  objective: {objective}\n"
+        )
+
+        assert cmd_status(Namespace(mission_path=str(mission_dir), verbose=False)) == 0
+
+        out = capsys.readouterr().out
+        objective_lines = out.split("Objective:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+        assert len(objective_lines) > 1
+        assert all(line.startswith("  ") and len(line) <= 70 for line in objective_lines)
+        assert " ".join(line.strip() for line in objective_lines) == objective
+
+    def test_usage_summary_reuses_loaded_progress(self, tmp_path, capsys):
+        """status parses progress.yaml once and summarizes usage from it."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        (mission_dir / "progress.yaml").write_text(
+            "current_agent: scientist\n"
+            "llm_usage:\n"
+            "  runs:\n"
+            "  - agent_role: scientist\n"
+            "    total_tokens: 1200\n"
+            "    cost_usd: 0.25\n"
+            "  total_tokens: 1200\n"
+            "  total_cost_usd: 0.25\n"
+        )
+
+        with patch("mycelium.orchestrator.load_progress", wraps=load_progress) as mock_load:
+            assert cmd_status(Namespace(mission_path=str(mission_dir), verbose=False)) == 0
+
+        assert mock_load.call_count == 1
+        out = capsys.readouterr().out
+        assert "  Total tokens: 1,200" in out
+        assert "  Total cost:   $0.250000" in out
+
+
+class TestCmdAuto:
+    """Tests for the auto-loop command."""
+
+    @staticmethod
+    def _args(mission_dir) -> Namespace:
+        return Namespace(
+            mission_path=str(mission_dir),
+            model=None,
+            no_tools=False,
+            verbose=False,
+            max_iterations=3,
+            max_cost=None,
+            max_failures=None,
+            approve=True,
+        )
+
+    def test_runs_until_mission_complete(self, tmp_path, capsys):
+        """Runs agents until current_agent clears and prints a summary."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        progress_file = mission_dir / "progress.yaml"
+        progress_file.write_text("current_agent: scientist\n")
+
+        def fake_run_agent(**kwargs):
+            progress_file.write_text("current_agent: ''\n")
+            return CompletionResponse(
+                content="done",
+                usage=UsageMetadata(total_tokens=42, cost_usd=0.01),
+            )
+
+        with patch.dict("os.environ", {}, clear=True), \
+                patch("mycelium.orchestrator.run_agent", side_effect=fake_run_agent) as mock_run:
+            exit_code = cmd_auto(self._args(mission_dir))
+
+        assert exit_code == 0
+        mock_run.assert_called_once()
+        out = capsys.readouterr().out
+        assert "🔄 SWITCHING AGENT: SCIENTIST" in out
+        assert "✓ Tokens: 42" in out
+        assert "✅ Mission complete!" in out
+        assert "📊 Auto mode complete after 1 iteration(s)" in out
+
+    def test_summary_reports_saved_usage_totals(self, tmp_path, capsys):
+        """The final summary reflects the llm_usage totals saved by the last run."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        progress_file = mission_dir / "progress.yaml"
+        progress_file.write_text(
+            "current_agent: scientist\n"
+            "llm_usage:\n  runs:\n  - total_tokens: 100\n    cost_usd: 0.5\n"
+            "  total_tokens: 100\n  total_cost_usd: 0.5\n"
+        )
+
+        def fake_run_agent(**kwargs):
+            progress_file.write_text(
+                "current_agent: ''\n"
+                "llm_usage:\n  runs:\n  - total_tokens: 100\n    cost_usd: 0.5\n"
+                "  - total_tokens: 42\n    cost_usd: 0.25\n"
+                "  total_tokens: 142\n  total_cost_usd: 0.75\n"
+            )
+            return CompletionResponse(usage=UsageMetadata(total_tokens=42, cost_usd=0.25))
+
+        with patch.dict("os.environ", {}, clear=True), \
+                patch("mycelium.orchestrator.run_agent", side_effect=fake_run_agent):
+            assert cmd_auto(self._args(mission_dir)) == 0
+
+        out = capsys.readouterr().out
+        assert "   Total tokens: 142" in out
+        assert "   Total cost: $0.750000" in out
+
+    def test_same_stamp_rewrite_is_reloaded(self, tmp_path, capsys):
+        """A same-size rewrite that keeps the mtime is still picked up."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        progress_file = mission_dir / "progress.yaml"
+        progress_file.write_text("current_agent: scientist\n")
+        before = progress_file.stat()
+
+        def fake_run_agent(**kwargs):
+            # Same length as "scientist"; restoring the mtime mimics a rewrite
+            # within one tick of a coarse filesystem clock.
+            progress_file.write_text("current_agent: ''       \n")
+            os.utime(progress_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+            return CompletionResponse(usage=UsageMetadata(total_tokens=1, cost_usd=0.0))
+
+        with patch.dict("os.environ", {}, clear=True), \
+                patch("mycelium.orchestrator.run_agent", side_effect=fake_run_agent) as mock_run:
+            exit_code = cmd_auto(self._args(mission_dir))
+
+        assert exit_code == 0
+        mock_run.assert_called_once()
+        assert "✅ Mission complete!" in capsys.readouterr().out
+
+    def test_unchanged_progress_is_not_reloaded(self, tmp_path, capsys):
+        """Skipped iterations reuse the parsed progress instead of re-reading it."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        (mission_dir / "progress.yaml").write_text("current_agent: implementer\n")
+        args = self._args(mission_dir)
+        args.approve = False
+        args.max_failures = 3
+
+        with patch.dict("os.environ", {}, clear=True), \
+                patch("builtins.input", return_value="n"), \
+                patch(
+                    "mycelium.orchestrator.load_progress_with_text",
+                    wraps=load_progress_with_text,
+                ) as mock_load:
+            exit_code = cmd_auto(args)
+
+        assert exit_code == 2
+        assert mock_load.call_count == 1
+        assert "Max consecutive failures (3) reached" in capsys.readouterr().out
+
+
+class TestMainParserSelection:
+    """Tests for lazy subcommand parser construction."""
+
+    def test_requested_command_detects_subcommand(self):
+        """The first positional token selects the subcommand parser."""
+        assert _requested_command(["-v", "status", "mission"]) == "status"
+
+    def test_help_and_unknown_commands_build_all_parsers(self):
+        """Top-level help, no command and unknown commands need every parser."""
+        assert _requested_command([]) is None
+        assert _requested_command(["--help"]) is None
+        assert _requested_command(["-h", "run"]) is None
+        assert _requested_command(["bogus"]) is None
+
+    def test_main_dispatches_with_only_selected_parser(self):
+        """main() builds just the requested parser and dispatches to it."""
+        with patch.dict(_SUBCOMMAND_BUILDERS, {"auto": MagicMock()}), \
+                patch("mycelium.cli.cmd_status", return_value=0) as mock_status:
+            assert main(["status", "mission"]) == 0
+            _SUBCOMMAND_BUILDERS["auto"].assert_not_called()
+
+        mock_status.assert_called_once()
+        assert mock_status.call_args.args[0].mission_path == "mission"
+
+
+class TestCmdRun:
+    """Tests for the run command output."""
+
+    def test_prints_agent_output_block(self, tmp_path, capsys):
+        """Agent output is framed by 60-column rules."""
+        mission_dir = tmp_path / "mission"
+        mission_dir.mkdir()
+        args = Namespace(mission_path=str(mission_dir), model=None, approve=True, dry_run=True)
+
+        with patch(
+            "mycelium.orchestrator.run_agent",
+            return_value=CompletionResponse(content="hello from agent"),
+        ):
+            assert cmd_run(args) == 0
+
+        out = capsys.readouterr().out
+        rule = "=" * 60
+        assert f"{rule}\nAGENT OUTPUT\n{rule}\nhello from agent\n{rule}\n\n" in out
+        assert "✅ Agent run complete" in out
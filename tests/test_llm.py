@@ -6,20 +6,120 @@ Test mode: SMOKE
 
 from __future__ import annotations
 
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import litellm
 import pytest
 
+import mycelium.llm
 from mycelium.llm import (
+    MAX_BACKOFF_SECONDS,
     CompletionResponse,
     UsageMetadata,
     _calculate_cost,
+    _jittered_backoff,
+    _model_provider,
+    _retry_after_seconds,
     _verify_api_keys,
+    _with_prompt_cache_marker,
     complete,
+    complete_batch,
+    complete_parallel,
+    complete_stream,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_llm_state():
+    """Keep rate-limit cooldowns and cached responses from leaking between tests."""
+    mycelium.llm._provider_cooldown_until.clear()
+    mycelium.llm._RESPONSE_CACHE.clear()
+    mycelium.llm._IN_FLIGHT.clear()
+    mycelium.llm._lookup_completion_cost.cache_clear()
+    yield
+    mycelium.llm._provider_cooldown_until.clear()
+    mycelium.llm._RESPONSE_CACHE.clear()
+    mycelium.llm._lookup_completion_cost.cache_clear()
+
+
+@pytest.fixture
+def mock_litellm_response():
+    """A successful litellm.completion() result with 100 prompt / 50 completion tokens."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Test response"
+    mock_response.usage.prompt_tokens = 100
+    mock_response.usage.completion_tokens = 50
+    return mock_response
+
+
+class TestLazyImport:
+    """Tests for deferred LiteLLM import."""
+
+    def test_orchestrator_import_does_not_load_litellm(self):
+        """Importing the CLI/orchestrator stack leaves LiteLLM unloaded."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, mycelium.cli, mycelium.orchestrator; "
+                "print('litellm' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_cli_import_does_not_load_llm_module(self):
+        """Importing the package and CLI defers mycelium.llm until needed."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, mycelium.cli; "
+                "print('mycelium.llm' in sys.modules, 'email.utils' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False False"
+
+    def test_package_complete_resolves_lazily(self):
+        """mycelium.complete is still importable from the package root."""
+        import mycelium
+        from mycelium.llm import complete
+
+        assert mycelium.complete is complete
+
+    def test_preload_client_imports_in_background(self):
+        """preload_client loads LiteLLM on a daemon thread."""
+        import mycelium.llm
+
+        with patch.object(mycelium.llm, "_load_litellm") as mock_load:
+            thread = mycelium.llm.preload_client()
+            thread.join(timeout=5)
+
+        assert thread.daemon is True
+        mock_load.assert_called_once_with()
+
+    def test_module_attribute_loads_litellm(self):
+        """mycelium.llm.litellm resolves to the LiteLLM module on demand."""
+        import mycelium.llm
+
+        assert mycelium.llm.litellm is litellm
+
+
 class TestUsageMetadata:
     """Tests for UsageMetadata dataclass."""
 
@@ -129,6 +229,26 @@ class TestVerifyApiKeys:
             assert "openai" in result
 
 
+class TestModelProvider:
+    """Tests for model-to-provider resolution."""
+
+    @pytest.mark.parametrize(
+        ("model", "provider"),
+        [
+            ("anthropic/claude-sonnet-4-20250514", "anthropic"),
+            ("claude-3-haiku", "anthropic"),
+            ("gpt-4o", "openai"),
+            ("openai/gpt-5", "openai"),
+            ("gemini/gemini-1.5-pro", "google"),
+            ("mistral-large", "openai"),
+            ("ollama/llama3", "ollama"),
+        ],
+    )
+    def test_resolves_provider(self, model, provider):
+        """Aliases win over the provider segment; bare names default to openai."""
+        assert _model_provider(model) == provider
+
+
 class TestCalculateCost:
     """Tests for _calculate_cost helper."""
 
@@ -141,6 +261,117 @@ class TestCalculateCost:
         assert cost > 0
         assert isinstance(cost, float)
 
+    def test_litellm_cost_memoized(self):
+        """Repeated token counts for a model are priced once."""
+        with patch("mycelium.llm.litellm.completion_cost", return_value=0.25) as mock_cost:
+            first = _calculate_cost("anthropic/claude-sonnet-4-20250514", 1000, 500)
+            second = _calculate_cost("anthropic/claude-sonnet-4-20250514", 1000, 500)
+
+        assert first == second == 0.25
+        mock_cost.assert_called_once()
+
+    def test_cached_prompt_tokens_use_cache_rates(self):
+        """Cache reads and writes are priced through LiteLLM's per-token rates."""
+        with patch(
+            "mycelium.llm.litellm.cost_per_token", return_value=(0.002, 0.001)
+        ) as mock_per_token, patch("mycelium.llm.litellm.completion_cost") as mock_cost:
+            cost = _calculate_cost("anthropic/claude-sonnet-4-20250514", 1000, 500, 800, 100)
+
+        assert cost == pytest.approx(0.003)
+        mock_cost.assert_not_called()
+        mock_per_token.assert_called_once_with(
+            model="anthropic/claude-sonnet-4-20250514",
+            prompt_tokens=1000,
+            completion_tokens=500,
+            cache_read_input_tokens=800,
+            cache_creation_input_tokens=100,
+        )
+
+    def test_unpriced_model_with_cached_tokens_uses_estimate(self):
+        """A model cost_per_token can't price is estimated, not recorded as free."""
+        model = "anthropic/claude-sonnet-4-20250514"
+        with_cache = _calculate_cost(model, 1000, 500, cache_read_tokens=800)
+
+        assert with_cache > 0
+
+    def test_fallback_estimate_discounts_cache_reads(self):
+        """The fallback estimate charges less when the prompt was mostly cached."""
+        fresh = _calculate_cost("fake/model", 1000, 0)
+        cached = _calculate_cost("fake/model", 1000, 0, cache_read_tokens=800)
+
+        assert cached == pytest.approx(fresh * 0.28)
+
+
+class TestJitteredBackoff:
+    """Tests for retry backoff jitter."""
+
+    def test_delay_within_jitter_window(self):
+        """Jittered delay stays between the base backoff and twice that."""
+        for _ in range(50):
+            delay = _jittered_backoff(2.0)
+            assert 2.0 <= delay <= 4.0
+
+    def test_delay_capped(self):
+        """Jittered delay never exceeds MAX_BACKOFF_SECONDS."""
+        assert _jittered_backoff(MAX_BACKOFF_SECONDS * 4) == MAX_BACKOFF_SECONDS
+
+
+class TestRetryAfterSeconds:
+    """Tests for Retry-After header parsing."""
+
+    @staticmethod
+    def _error(headers):
+        return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+    def test_delta_seconds(self):
+        """Numeric Retry-After values are read as seconds."""
+        assert _retry_after_seconds(self._error({"retry-after": "7"})) == 7.0
+
+    def test_http_date(self):
+        """HTTP-date Retry-After values are converted to a delay from now."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        headers = {"retry-after": format_datetime(retry_at, usegmt=True)}
+
+        delay = _retry_after_seconds(self._error(headers))
+
+        assert delay is not None
+        assert 25.0 <= delay <= 30.0
+
+    def test_capped(self):
+        """Retry-After hints are capped at MAX_BACKOFF_SECONDS."""
+        assert _retry_after_seconds(self._error({"retry-after": "3600"})) == MAX_BACKOFF_SECONDS
+
+    def test_missing_or_invalid(self):
+        """Missing or unparseable hints yield None."""
+        assert _retry_after_seconds(Exception("boom")) is None
+        assert _retry_after_seconds(self._error({})) is None
+        assert _retry_after_seconds(self._error({"retry-after": "soon"})) is None
+
+
+class TestPromptCacheMarker:
+    """Tests for Anthropic prompt-cache markers."""
+
+    def test_marks_system_message(self):
+        """The system prompt becomes a single cache-controlled text block."""
+        messages = [
+            {"role": "system", "content": "Long contract"},
+            {"role": "user", "content": "Go"},
+        ]
+
+        marked = _with_prompt_cache_marker(messages)
+
+        assert marked[0]["content"] == [
+            {"type": "text", "text": "Long contract", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert marked[1] is messages[1]
+        assert messages[0]["content"] == "Long contract"
+
+    def test_without_system_message_unchanged(self):
+        """Messages without a system prompt are passed through as-is."""
+        messages = [{"role": "user", "content": "Go"}]
+
+        assert _with_prompt_cache_marker(messages) is messages
+
 
 class TestComplete:
     """Tests for complete() function."""
@@ -155,14 +386,10 @@ class TestComplete:
             assert response.success is False
             assert "No API keys found" in response.error
 
-    def test_returns_structured_response(self):
+    def test_returns_structured_response(self, mock_litellm_response):
         """Returns CompletionResponse with usage metadata."""
         # Mock litellm.completion
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 50
+        mock_response = mock_litellm_response
         
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
             with patch("mycelium.llm.litellm.completion", return_value=mock_response):
@@ -179,15 +406,10 @@ class TestComplete:
         assert response.usage.total_tokens == 150
         assert response.usage.cost_usd == 0.005
 
-    def test_retry_on_rate_limit(self):
+    def test_retry_on_rate_limit(self, mock_litellm_response):
         """Retries on rate limit errors."""
-        import litellm
-        
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
+        mock_response = mock_litellm_response
         mock_response.choices[0].message.content = "Success after retry"
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 50
         
         # Fail twice, then succeed
         call_count = [0]
@@ -214,6 +436,205 @@ class TestComplete:
         assert response.success is True
         assert call_count[0] == 3  # Two failures + one success
 
+    def test_retry_sleeps_use_jitter(self):
+        """Retry sleeps are jittered around the exponential schedule."""
+        error = litellm.RateLimitError(
+            message="Rate limit exceeded",
+            llm_provider="anthropic",
+            model="claude",
+            response=MagicMock(),
+        )
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", side_effect=error):
+                with patch("mycelium.llm.random.uniform", return_value=0.25) as mock_uniform:
+                    with patch("time.sleep") as mock_sleep:
+                        complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 1.0), (0, 2.0)]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.25, 2.25]
+
+    def test_retry_sleep_honors_retry_after(self):
+        """A provider Retry-After hint replaces the local backoff delay."""
+        error = litellm.RateLimitError(
+            message="Rate limit exceeded",
+            llm_provider="anthropic",
+            model="claude",
+            response=MagicMock(),
+        )
+        error.response = SimpleNamespace(headers={"retry-after": "0.5"})
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", side_effect=error):
+                with patch("time.sleep") as mock_sleep:
+                    complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.5]
+
+    def test_waits_for_provider_cooldown(self, mock_litellm_response):
+        """A call during a provider cooldown waits before hitting the API."""
+        mock_response = mock_litellm_response
+
+        mycelium.llm._provider_cooldown_until["anthropic"] = 110.0
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", return_value=mock_response):
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    with patch("mycelium.llm.time.monotonic", return_value=100.0):
+                        with patch("time.sleep") as mock_sleep:
+                            response = complete(
+                                messages=[{"role": "user", "content": "Hello"}],
+                            )
+
+        assert response.success is True
+        mock_sleep.assert_called_once_with(10.0)
+
+    def test_rate_limit_sets_provider_cooldown(self):
+        """A rate-limit error starts a cooldown for the model's provider."""
+        error = litellm.RateLimitError(
+            message="Rate limit exceeded",
+            llm_provider="anthropic",
+            model="claude",
+            response=MagicMock(),
+        )
+        error.response = SimpleNamespace(headers={"retry-after": "5"})
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", side_effect=error):
+                with patch("time.sleep"):
+                    complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert mycelium.llm._provider_cooldown_until["anthropic"] > time.monotonic()
+
+    def test_identical_deterministic_call_served_from_cache(self, mock_litellm_response):
+        """A repeated temperature-0 request reuses the response without billing."""
+        mock_response = mock_litellm_response
+        mock_response.choices[0].message.content = "Cached response"
+
+        messages = [{"role": "user", "content": "Hello"}]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=mock_response
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    first = complete(messages=messages)
+                    second = complete(messages=messages)
+
+        assert mock_completion.call_count == 1
+        assert second.content == first.content == "Cached response"
+        assert second.usage.total_tokens == 0
+        assert second.usage.cost_usd == 0.0
+        assert first.usage.cost_usd == 0.005
+
+    def test_concurrent_identical_calls_share_one_request(self, mock_litellm_response):
+        """A deterministic request already in flight is not sent a second time."""
+        mock_response = mock_litellm_response
+        mock_response.choices[0].message.content = "Shared response"
+        messages = [{"role": "user", "content": "Hello"}]
+        followers: list[CompletionResponse] = []
+
+        def fake_completion(**kwargs):
+            # Start an identical call while this one is still in flight.
+            follower = threading.Thread(
+                target=lambda: followers.append(complete(messages=messages))
+            )
+            follower.start()
+            time.sleep(0.05)
+            fake_completion.follower = follower
+            return mock_response
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", side_effect=fake_completion
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    first = complete(messages=messages)
+                    fake_completion.follower.join(timeout=5)
+
+        assert mock_completion.call_count == 1
+        assert first.content == followers[0].content == "Shared response"
+        assert followers[0].usage.cost_usd == 0.0
+        assert mycelium.llm._IN_FLIGHT == {}
+
+    def test_failed_in_flight_call_is_not_shared(self):
+        """Waiters make their own request when the in-flight one fails."""
+        messages = [{"role": "user", "content": "Hello"}]
+        claimed = mycelium.llm._claim_in_flight(
+            mycelium.llm._response_cache_key(
+                mycelium.llm.DEFAULT_MODEL, messages, 0.0, 8192, None, None
+            )
+        )
+        claimed.set()  # Waiters return immediately and find no cached response.
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Own response"
+        mock_response.usage.prompt_tokens = 1
+        mock_response.usage.completion_tokens = 1
+
+        try:
+            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+                with patch(
+                    "mycelium.llm.litellm.completion", return_value=mock_response
+                ) as mock_completion:
+                    response = complete(messages=messages)
+        finally:
+            mycelium.llm._IN_FLIGHT.clear()
+
+        assert mock_completion.call_count == 1
+        assert response.content == "Own response"
+
+    def test_nonzero_temperature_bypasses_cache(self, mock_litellm_response):
+        """Sampled (temperature > 0) requests are never served from cache."""
+        mock_response = mock_litellm_response
+        mock_response.choices[0].message.content = "Fresh response"
+
+        messages = [{"role": "user", "content": "Hello"}]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=mock_response
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    complete(messages=messages, temperature=0.7)
+                    complete(messages=messages, temperature=0.7)
+
+        assert mock_completion.call_count == 2
+
+    def test_gemini_zero_temperature_bypasses_cache(self, mock_litellm_response):
+        """Gemini requests are sent at temperature 1.0, so they are not cached."""
+        mock_response = mock_litellm_response
+        mock_response.choices[0].message.content = "Fresh response"
+
+        messages = [{"role": "user", "content": "Hello"}]
+        with patch.dict("os.environ", {"GOOGLE_API_KEY": "test-key"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=mock_response
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    complete(messages=messages, model="gemini/gemini-2.0-flash")
+                    complete(messages=messages, model="gemini/gemini-2.0-flash")
+
+        assert mock_completion.call_count == 2
+        assert mock_completion.call_args.kwargs["temperature"] == 1.0
+
+    def test_anthropic_request_marks_system_prompt(self, mock_litellm_response):
+        """Anthropic calls send the system prompt with a cache_control marker."""
+        mock_response = mock_litellm_response
+
+        messages = [
+            {"role": "system", "content": "Contract"},
+            {"role": "user", "content": "Hello"},
+        ]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=mock_response
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    complete(messages=messages, model="anthropic/claude-sonnet-4-20250514")
+
+        sent = mock_completion.call_args.kwargs["messages"]
+        assert sent[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[0]["content"] == "Contract"
+
     def test_coerces_string_usage_fields(self):
         """String usage fields should be coerced to non-negative ints."""
         mock_response = MagicMock()
@@ -235,7 +656,48 @@ class TestComplete:
         assert response.usage.prompt_tokens == 100
         assert response.usage.completion_tokens == 50
         assert response.usage.total_tokens == 175
-        mock_cost.assert_called_once_with("anthropic/claude-sonnet-4-20250514", 100, 50)
+        mock_cost.assert_called_once_with("anthropic/claude-sonnet-4-20250514", 100, 50, 0, 0)
+
+    def test_passes_cached_prompt_tokens_to_cost(self):
+        """Provider-reported cache reads and writes reach the cost calculation."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test response"
+        mock_response.usage.prompt_tokens = 1000
+        mock_response.usage.completion_tokens = 50
+        mock_response.usage.total_tokens = 1050
+        mock_response.usage.cache_read_input_tokens = 800
+        mock_response.usage.cache_creation_input_tokens = 100
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", return_value=mock_response):
+                with patch("mycelium.llm._calculate_cost", return_value=0.001) as mock_cost:
+                    response = complete(
+                        messages=[{"role": "user", "content": "Hello"}],
+                        model="anthropic/claude-sonnet-4-20250514",
+                    )
+
+        assert response.usage.cost_usd == 0.001
+        mock_cost.assert_called_once_with("anthropic/claude-sonnet-4-20250514", 1000, 50, 800, 100)
+
+    def test_reads_openai_cached_tokens_from_prompt_details(self):
+        """OpenAI-style prompt_tokens_details.cached_tokens counts as a cache read."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test response"
+        mock_response.usage.prompt_tokens = 1000
+        mock_response.usage.completion_tokens = 50
+        mock_response.usage.prompt_tokens_details.cached_tokens = 640
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", return_value=mock_response):
+                with patch("mycelium.llm._calculate_cost", return_value=0.001) as mock_cost:
+                    complete(
+                        messages=[{"role": "user", "content": "Hello"}],
+                        model="openai/gpt-4o",
+                    )
+
+        mock_cost.assert_called_once_with("openai/gpt-4o", 1000, 50, 640, 0)
 
     def test_clamps_invalid_usage_and_cost(self):
         """Malformed usage/cost values should clamp to safe numeric defaults."""
@@ -259,7 +721,7 @@ class TestComplete:
         assert response.usage.completion_tokens == 0
         assert response.usage.total_tokens == 0
         assert response.usage.cost_usd == 0.0
-        mock_cost.assert_called_once_with("anthropic/claude-sonnet-4-20250514", 0, 0)
+        mock_cost.assert_called_once_with("anthropic/claude-sonnet-4-20250514", 0, 0, 0, 0)
 
     def test_normalizes_mixed_tool_call_payloads(self):
         """Mixed object/dict tool_call payloads should normalize and skip invalid entries."""
@@ -356,8 +818,6 @@ class TestComplete:
 
     def test_no_retry_on_auth_error(self):
         """Does not retry on authentication errors."""
-        import litellm
-        
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
             with patch(
                 "mycelium.llm.litellm.completion",
@@ -375,10 +835,76 @@ class TestComplete:
         assert response.success is False
         assert "Authentication failed" in response.error
 
+    def test_retries_transient_server_error(self):
+        """5xx and connection errors are retried."""
+        error = litellm.InternalServerError(
+            message="Overloaded",
+            llm_provider="anthropic",
+            model="claude",
+        )
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", side_effect=error
+            ) as mock_completion:
+                with patch("time.sleep"):
+                    response = complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert response.success is False
+        assert mock_completion.call_count == 3
+
+    def test_retries_timeout(self):
+        """litellm.Timeout is retried even though its status code is 408."""
+        error = litellm.Timeout(
+            message="Request timed out",
+            model="claude",
+            llm_provider="anthropic",
+        )
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", side_effect=error
+            ) as mock_completion:
+                with patch("time.sleep"):
+                    response = complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert response.success is False
+        assert mock_completion.call_count == 3
+
+    def test_no_retry_on_permanent_error(self):
+        """Non-transient errors fail on the first attempt."""
+        error = litellm.NotFoundError(
+            message="Model not found",
+            llm_provider="anthropic",
+            model="claude",
+        )
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", side_effect=error
+            ) as mock_completion:
+                with patch("time.sleep") as mock_sleep:
+                    response = complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert response.success is False
+        assert "Model not found" in response.error
+        assert mock_completion.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_no_retry_on_malformed_response(self):
+        """A response that cannot be parsed is reported, not retried."""
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=SimpleNamespace(choices=[])
+            ) as mock_completion:
+                with patch("time.sleep"):
+                    response = complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert response.success is False
+        assert mock_completion.call_count == 1
+
     def test_exhausted_retries(self):
         """Returns error after all retries exhausted."""
-        import litellm
-        
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
             with patch(
                 "mycelium.llm.litellm.completion",
@@ -396,3 +922,168 @@ class TestComplete:
         
         assert response.success is False
         assert "Failed after 3 retries" in response.error
+
+
+def _stream_chunk(content=None, tool_calls=None, usage=None):
+    """Build a LiteLLM-style streaming chunk."""
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    choices = [] if usage is not None else [SimpleNamespace(delta=delta)]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class TestCompleteStream:
+    """Tests for complete_stream()."""
+
+    def test_yields_partial_content_then_final_usage(self):
+        """Partial responses accumulate content; the last one has usage."""
+        chunks = [
+            _stream_chunk("Hel"),
+            _stream_chunk("lo"),
+            _stream_chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=2, total_tokens=12)),
+        ]
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", return_value=iter(chunks)
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.001):
+                    responses = list(
+                        complete_stream(messages=[{"role": "user", "content": "Hi"}])
+                    )
+
+        assert [r.content for r in responses] == ["Hel", "Hello", "Hello"]
+        assert responses[-1].success is True
+        assert responses[-1].usage.total_tokens == 12
+        assert responses[-1].usage.cost_usd == 0.001
+        assert mock_completion.call_args.kwargs["stream"] is True
+
+    def test_assembles_tool_call_fragments(self):
+        """Tool-call argument fragments are joined by index."""
+        chunks = [
+            _stream_chunk(tool_calls=[
+                {"index": 0, "id": "call_1", "function": {"name": "read_file", "arguments": '{"pa'}},
+            ]),
+            _stream_chunk(tool_calls=[
+                {"index": 0, "function": {"arguments": 'th": "a.py"}'}},
+            ]),
+        ]
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", return_value=iter(chunks)):
+                with patch("mycelium.llm._calculate_cost", return_value=0.0):
+                    final = list(
+                        complete_stream(messages=[{"role": "user", "content": "Hi"}])
+                    )[-1]
+
+        assert final.tool_calls == [
+            {"id": "call_1", "name": "read_file", "arguments": '{"path": "a.py"}'}
+        ]
+
+    def test_error_mid_stream_keeps_partial_content(self):
+        """A failure after some chunks reports the error with content so far."""
+        def failing_stream():
+            yield _stream_chunk("partial")
+            raise RuntimeError("connection reset")
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch("mycelium.llm.litellm.completion", return_value=failing_stream()):
+                final = list(
+                    complete_stream(messages=[{"role": "user", "content": "Hi"}])
+                )[-1]
+
+        assert final.success is False
+        assert final.content == "partial"
+        assert "connection reset" in final.error
+
+
+class TestCompleteParallel:
+    """Tests for complete_parallel()."""
+
+    def test_preserves_request_order(self):
+        """Responses come back in request order."""
+        def fake_complete(messages, **kwargs):
+            return CompletionResponse(content=messages[0]["content"].upper())
+
+        requests = [
+            {"messages": [{"role": "user", "content": word}]}
+            for word in ("alpha", "beta", "gamma")
+        ]
+        with patch("mycelium.llm.complete", side_effect=fake_complete):
+            responses = complete_parallel(requests, max_workers=2)
+
+        assert [r.content for r in responses] == ["ALPHA", "BETA", "GAMMA"]
+
+    def test_passes_request_kwargs(self):
+        """Each request dict is forwarded to complete() as keyword arguments."""
+        with patch(
+            "mycelium.llm.complete", return_value=CompletionResponse()
+        ) as mock_complete:
+            complete_parallel([
+                {"messages": [], "model": "openai/gpt-4o", "agent_role": "verifier"},
+            ])
+
+        mock_complete.assert_called_once_with(
+            messages=[], model="openai/gpt-4o", agent_role="verifier"
+        )
+
+    def test_empty_requests(self):
+        """No requests means no work and no executor."""
+        assert complete_parallel([]) == []
+
+
+class TestCompleteBatch:
+    """Tests for complete_batch()."""
+
+    def test_returns_structured_response_per_message_list(self):
+        """Each message list gets its own CompletionResponse, in order."""
+        def fake_completion(**kwargs):
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = kwargs["messages"][-1]["content"]
+            mock_response.choices[0].message.tool_calls = None
+            mock_response.usage.prompt_tokens = 100
+            mock_response.usage.completion_tokens = 50
+            return mock_response
+
+        messages_list = [
+            [{"role": "user", "content": f"question {i}"}] for i in range(4)
+        ]
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            with patch(
+                "mycelium.llm.litellm.completion", side_effect=fake_completion
+            ) as mock_completion:
+                with patch("mycelium.llm._calculate_cost", return_value=0.005):
+                    responses = complete_batch(messages_list, agent_role="scientist")
+
+        assert mock_completion.call_count == 4
+        assert [r.content for r in responses] == [f"question {i}" for i in range(4)]
+        assert all(r.success and r.usage.total_tokens == 150 for r in responses)
+        assert sum(r.usage.cost_usd for r in responses) == pytest.approx(0.02)
+
+    def test_shared_system_prompt_warms_cache_first(self):
+        """With a shared system prompt the first call finishes before the rest start."""
+        system = {"role": "system", "content": "shared instructions"}
+        messages_list = [
+            [system, {"role": "user", "content": str(i)}] for i in range(3)
+        ]
+        events = []
+
+        def fake_complete(messages, **kwargs):
+            events.append(messages[-1]["content"])
+            return CompletionResponse(content=messages[-1]["content"])
+
+        with patch("mycelium.llm.complete", side_effect=fake_complete), patch(
+            "mycelium.llm.complete_parallel",
+            wraps=mycelium.llm.complete_parallel,
+        ) as mock_parallel:
+            responses = complete_batch(messages_list, model="openai/gpt-4o")
+
+        assert events[0] == "0"
+        assert [r.content for r in responses] == ["0", "1", "2"]
+        assert [request["messages"] for request in mock_parallel.call_args.args[0]] == [
+            messages_list[1], messages_list[2]
+        ]
+
+    def test_empty_batch(self):
+        """No message lists means no calls."""
+        assert complete_batch([]) == []
@@ -6,8 +6,12 @@ Covers all 7 tools with happy path, edge cases, and error handling.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -30,6 +34,11 @@ from mycelium.mcp.server import (
 )
 import mycelium.mcp.server as _server
 
+# Same libyaml-backed loader/dumper the server uses, so fixtures and
+# assertions don't pay for the pure-Python parser.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # =============================================================================
 # Fixtures
@@ -67,7 +76,7 @@ def sample_progress_yaml(temp_dir):
     
     progress_file = temp_dir / "progress.yaml"
     with open(progress_file, "w") as f:
-        yaml.safe_dump(progress, f)
+        yaml.dump(progress, f, Dumper=_YAML_DUMPER)
     
     return progress_file
 
@@ -109,6 +118,39 @@ class TestReadProgress:
         assert isinstance(result, dict)
         assert result["current_agent"] == "implementer"
     
+    def test_repeated_read_skips_reparse(self, sample_progress_yaml):
+        """Unchanged progress.yaml is served from cache without re-parsing."""
+        read_progress(str(sample_progress_yaml))
+
+        with patch("mycelium.progress_cache.yaml.load") as mock_load:
+            result = read_progress(str(sample_progress_yaml))
+
+        mock_load.assert_not_called()
+        assert result["current_agent"] == "implementer"
+
+    def test_cache_shared_with_orchestrator(self, sample_progress_yaml):
+        """A tool update seeds the cache the orchestrator loads from."""
+        from mycelium.orchestrator import load_progress
+
+        update_progress(str(sample_progress_yaml), "current_agent", {"value": "verifier"})
+
+        with patch("mycelium.progress_cache.yaml.load") as mock_load:
+            progress = load_progress(sample_progress_yaml)
+
+        mock_load.assert_not_called()
+        assert progress["current_agent"] == "verifier"
+
+    def test_cached_read_is_isolated_and_sees_updates(self, sample_progress_yaml):
+        """Mutating a read result does not leak; tool updates are picked up."""
+        result = read_progress(str(sample_progress_yaml))
+        result["mission_context"]["phase"] = "mutated"
+
+        assert read_progress(str(sample_progress_yaml))["mission_context"]["phase"] == "Testing"
+
+        update_progress(str(sample_progress_yaml), "current_agent", {"value": "verifier"})
+
+        assert read_progress(str(sample_progress_yaml))["current_agent"] == "verifier"
+
     def test_read_nonexistent_mission(self, temp_dir):
         """read_progress raises error for non-existent mission."""
         nonexistent = temp_dir / "does_not_exist"
@@ -160,7 +202,7 @@ class TestUpdateProgress:
         
         # Verify the file was actually updated
         with open(sample_progress_yaml) as f:
-            saved = yaml.safe_load(f)
+            saved = yaml.load(f, Loader=_YAML_LOADER)
         assert saved["current_agent"] == "verifier"
     
     def test_update_preserves_unmodified(self, sample_progress_yaml):
@@ -174,11 +216,38 @@ class TestUpdateProgress:
         )
         
         with open(sample_progress_yaml) as f:
-            updated = yaml.safe_load(f)
+            updated = yaml.load(f, Loader=_YAML_LOADER)
         
         assert updated["mission_context"] == original["mission_context"]
         assert updated["scientist_plan"] == original["scientist_plan"]
     
+    def test_update_preserves_file_mode(self, sample_progress_yaml):
+        """The atomic rewrite keeps progress.yaml's permissions."""
+        os.chmod(sample_progress_yaml, 0o640)
+
+        update_progress(
+            str(sample_progress_yaml.parent),
+            "current_agent",
+            {"value": "verifier"},
+        )
+
+        assert sample_progress_yaml.stat().st_mode & 0o777 == 0o640
+    
+    def test_update_failed_write_leaves_file_intact(self, sample_progress_yaml):
+        """A failure while writing does not truncate the existing progress.yaml."""
+        before = sample_progress_yaml.read_text()
+
+        with patch("mycelium.atomic_write.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(ValueError, match="Failed to write YAML"):
+                update_progress(
+                    str(sample_progress_yaml.parent),
+                    "current_agent",
+                    {"value": "verifier"},
+                )
+
+        assert sample_progress_yaml.read_text() == before
+        assert list(sample_progress_yaml.parent.glob(".progress.yaml.*.tmp")) == []
+
     def test_update_invalid_section(self, sample_progress_yaml):
         """update_progress raises error for invalid section."""
         with pytest.raises(ValueError, match="Invalid section"):
@@ -221,7 +290,7 @@ class TestUpdateProgress:
             )
 
         with open(sample_progress_yaml) as f:
-            saved = yaml.safe_load(f)
+            saved = yaml.load(f, Loader=_YAML_LOADER)
         assert saved["implementer_log"] == []
 
     def test_update_dict_section_requires_mapping_payload(self, sample_progress_yaml):
@@ -251,6 +320,16 @@ class TestUpdateProgress:
 class TestListFiles:
     """Tests for list_files tool."""
     
+    def test_list_reports_symlinked_directory_as_directory(self, sample_files):
+        """Symlinks are classified by their target, as before."""
+        (sample_files / "link_to_subdir").symlink_to(sample_files / "subdir")
+
+        result = list_files(str(sample_files))
+
+        entry = next(f for f in result if f["name"] == "link_to_subdir")
+        assert entry["type"] == "directory"
+        assert "size" not in entry
+
     def test_list_valid_directory(self, sample_files):
         """list_files returns file list for valid directory."""
         result = list_files(str(sample_files))
@@ -337,6 +416,97 @@ class TestReadFile:
         with pytest.raises(ValueError, match="Failed to decode"):
             read_file(str(binary_file), encoding="utf-8")
 
+    @pytest.mark.parametrize(
+        "raw",
+        [b"one\r\ntwo\rthree\n", b"", "caf\u00e9\n".encode("utf-16")],
+        ids=["newlines", "empty", "utf-16"],
+    )
+    def test_read_whole_file_matches_read_text(self, temp_dir, raw):
+        """Whole-file reads decode like Path.read_text, newlines included."""
+        target = temp_dir / "text.txt"
+        target.write_bytes(raw)
+        encoding = "utf-16" if raw.startswith(b"\xff\xfe") else "utf-8"
+
+        assert read_file(str(target), encoding=encoding) == target.read_text(
+            encoding=encoding
+        )
+
+    def test_read_byte_range(self, temp_dir):
+        """offset/max_bytes read only the requested slice."""
+        target = temp_dir / "log.txt"
+        target.write_text("0123456789")
+
+        assert read_file(str(target), offset=3, max_bytes=4) == "3456"
+        assert read_file(str(target), offset=8) == "89"
+
+    def test_read_range_holds_back_split_character(self, temp_dir):
+        """A multi-byte character cut by max_bytes is not decoded as garbage."""
+        target = temp_dir / "utf8.txt"
+        target.write_text("ab\u00e9cd", encoding="utf-8")  # é is two bytes
+
+        assert read_file(str(target), max_bytes=3) == "ab"
+        assert read_file(str(target), offset=2, max_bytes=3) == "\u00e9c"
+
+    def test_ranges_split_inside_character_compose(self, temp_dir):
+        """A character cut by one range is returned whole by the next one."""
+        target = temp_dir / "utf8.txt"
+        target.write_text("a\u00e9" * 5, encoding="utf-8")  # 3 bytes per pair
+
+        assert read_file(str(target), max_bytes=2) == "a"
+        assert read_file(str(target), offset=2, max_bytes=2) == "\u00e9a"
+        chunks = [read_file(str(target), offset=o, max_bytes=2) for o in range(0, 15, 2)]
+        assert "".join(chunks) == read_file(str(target))
+
+    def test_range_reaching_eof_translates_trailing_cr(self, temp_dir):
+        """A "\\r" at EOF becomes "\\n" in ranged reads, as in whole-file reads."""
+        target = temp_dir / "cr.txt"
+        target.write_bytes(b"ab\r")
+
+        assert read_file(str(target)) == "ab\n"
+        assert read_file(str(target), offset=1) == "b\n"
+        assert read_file(str(target), offset=0, max_bytes=3) == "ab\n"
+        assert read_file(str(target), max_bytes=2) + read_file(str(target), offset=2) == "ab\n"
+
+    def test_read_whole_file_over_limit(self, temp_dir):
+        """Whole-file reads above the limit ask for a ranged read instead."""
+        target = temp_dir / "big.txt"
+        target.write_text("x" * 64)
+
+        with patch.object(_server, "READ_FILE_MAX_BYTES", 16):
+            with pytest.raises(ValueError, match="offset/max_bytes"):
+                read_file(str(target))
+            assert read_file(str(target), max_bytes=8) == "x" * 8
+
+    def test_read_range_without_max_bytes_over_limit(self, temp_dir):
+        """A nonzero offset does not bypass the read limit."""
+        target = temp_dir / "big.txt"
+        target.write_text("x" * 64)
+
+        with patch.object(_server, "READ_FILE_MAX_BYTES", 16):
+            with pytest.raises(ValueError, match="pass max_bytes"):
+                read_file(str(target), offset=1)
+            assert read_file(str(target), offset=60) == "x" * 4
+
+    def test_read_range_max_bytes_capped_at_limit(self, temp_dir):
+        """max_bytes above the limit is clamped to it."""
+        target = temp_dir / "big.txt"
+        target.write_text("x" * 64)
+
+        with patch.object(_server, "READ_FILE_MAX_BYTES", 16):
+            assert read_file(str(target), offset=1, max_bytes=1000) == "x" * 16
+
+    def test_ranged_and_whole_reads_translate_newlines_alike(self, temp_dir):
+        """Ranged reads return the same text as whole-file reads for CRLF files."""
+        target = temp_dir / "crlf.txt"
+        target.write_bytes(b"one\r\ntwo\rthree\r\n")
+
+        whole = read_file(str(target))
+        assert whole == "one\ntwo\nthree\n"
+        assert read_file(str(target), offset=0, max_bytes=64) == whole
+        assert read_file(str(target), offset=1) == whole[1:]
+        # A range ending between "\r" and "\n" yields one newline in total.
+        assert read_file(str(target), max_bytes=4) + read_file(str(target), offset=4) == whole
+
 
 # =============================================================================
 # Tests: write_file
@@ -524,10 +694,10 @@ class TestHITLGate:
     def test_write_requires_approval_with_malformed_nested_implementer(self, sample_progress_yaml, temp_dir):
         """Malformed nested current_agent payloads should still enforce HITL approval."""
         with open(sample_progress_yaml) as f:
-            progress = yaml.safe_load(f)
+            progress = yaml.load(f, Loader=_YAML_LOADER)
         progress["current_agent"] = {"current_agent": {"value": "implementer"}}
         with open(sample_progress_yaml, "w") as f:
-            yaml.dump(progress, f)
+            yaml.dump(progress, f, Dumper=_YAML_DUMPER)
 
         target = temp_dir / "malformed-guard.txt"
         result = write_file(
@@ -604,18 +774,71 @@ class TestRunCommand:
         assert result["approval_required"] is True
         assert "HITL approval required" in result["message"]
 
+    def test_mcp_tool_runs_commands_off_the_event_loop(self):
+        """Concurrent run_command tool calls execute in parallel worker threads."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_run(command, cwd, mission_path, timeout):
+            barrier.wait()  # Only returns once both calls are running at once.
+            return {"success": True, "stdout": command}
+
+        async def run_both():
+            return await asyncio.gather(
+                _server.run_command("echo a"), _server.run_command("echo b")
+            )
+
+        with patch.object(_server, "_run_command", side_effect=fake_run):
+            results = asyncio.run(run_both())
+
+        assert [r["stdout"] for r in results] == ["echo a", "echo b"]
+
     def test_run_handles_timeout(self, temp_dir):
         """run_command handles command timeout."""
-        # Use 'tail -f /dev/null' which blocks indefinitely using an allowed command
-        result = self._run(
-            "tail -f /dev/null",
-            cwd=str(temp_dir),
-            timeout=1,
-        )
+        def time_out(proc, timeout):
+            proc.kill()
+            proc.wait()
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+
+        # Use 'tail -f /dev/null' which blocks indefinitely using an allowed
+        # command; the capped reader times out immediately instead of after 1s.
+        with patch.object(_server, "_communicate_capped", side_effect=time_out):
+            result = self._run(
+                "tail -f /dev/null",
+                cwd=str(temp_dir),
+                timeout=1,
+            )
 
         assert result["success"] is False
         assert "timed out" in result["error"]
 
+    def test_capped_reader_kills_process_at_deadline(self):
+        """The real timeout path kills a blocked process once the deadline passes."""
+        with subprocess.Popen(
+            ["tail", "-f", "/dev/null"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as proc:
+            with pytest.raises(subprocess.TimeoutExpired):
+                _server._communicate_capped(proc, 0.05)
+
+        assert proc.returncode is not None
+
+    def test_run_truncates_large_output(self, temp_dir):
+        """Output beyond the per-stream cap is dropped and reported."""
+        (temp_dir / "big.txt").write_text("x" * 100)
+
+        with patch.object(_server, "RUN_COMMAND_MAX_OUTPUT_BYTES", 10):
+            result = self._run("cat big.txt", cwd=str(temp_dir))
+
+        assert result["success"] is True
+        assert result["stdout"] == "x" * 10 + "\n...[truncated 90 bytes]"
+
+    def test_run_captures_stdout_and_stderr(self, temp_dir):
+        """Both streams are captured separately."""
+        result = self._run("ls missing_file .", cwd=str(temp_dir))
+
+        assert result["exit_code"] != 0
+        assert "missing_file" in result["stderr"]
+        assert "missing_file" not in result["stdout"]
+
     def test_run_failing_command(self, temp_dir):
         """run_command captures exit code for failing commands."""
         # Use 'grep' with a pattern that won't match to get exit code 1
@@ -668,10 +891,10 @@ class TestRunCommand:
     def test_run_requires_approval_with_malformed_list_implementer(self, sample_progress_yaml, temp_dir):
         """Malformed list-shaped current_agent payloads should still enforce HITL approval."""
         with open(sample_progress_yaml) as f:
-            progress = yaml.safe_load(f)
+            progress = yaml.load(f, Loader=_YAML_LOADER)
         progress["current_agent"] = [{"unexpected": "shape"}, {"value": "implementer"}]
         with open(sample_progress_yaml, "w") as f:
-            yaml.dump(progress, f)
+            yaml.dump(progress, f, Dumper=_YAML_DUMPER)
 
         result = run_command(
             "echo 'should not run'",
@@ -781,6 +1004,133 @@ class TestSearchCodebase:
         # Should find fewer or no matches with case sensitive
         assert len(result_sensitive) <= len(result)
     
+    def test_search_literal_escapes_regex_metacharacters(self, temp_dir):
+        """Literal searches treat regex metacharacters as plain text."""
+        (temp_dir / "file.txt").write_text("call foo(a.b)\ncall fooXaYb\n")
+
+        result = search_codebase(
+            "FOO(A.B)",
+            directory=str(temp_dir),
+        )
+
+        assert [m["line_number"] for m in result] == [1]
+
+    @pytest.mark.skipif(_server.RIPGREP_PATH is None, reason="ripgrep not installed")
+    def test_search_ripgrep_matches_python_scan(self, sample_files):
+        """Literal searches give the same matches with and without ripgrep."""
+        (sample_files / "__pycache__").mkdir()
+        (sample_files / "__pycache__" / "cached.txt").write_text("content\n")
+
+        with_rg = search_codebase("CONTENT", directory=str(sample_files))
+        with patch.object(_server, "RIPGREP_PATH", None):
+            without_rg = search_codebase("CONTENT", directory=str(sample_files))
+
+        def key(match):
+            return (match["file"], match["line_number"])
+
+        assert sorted(with_rg, key=key) == sorted(without_rg, key=key)
+
+    def test_ripgrep_results_are_sorted_without_sort_flag(self, temp_dir):
+        """ripgrep stays multi-threaded; its completion-order output is sorted here."""
+        events = [
+            {"type": "match", "data": {
+                "path": {"text": path}, "line_number": line, "lines": {"text": "hit\n"},
+            }}
+            for path, line in [("b.txt", 3), ("a.txt", 7), ("b.txt", 1)]
+        ]
+        proc = subprocess.Popen(
+            ["printf", "%s\\n", *(json.dumps(event) for event in events)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+        with patch.object(_server.subprocess, "Popen", return_value=proc) as mock_popen:
+            result = _server._search_with_ripgrep("rg", "hit", temp_dir, "", False, 10)
+
+        assert not any(arg.startswith("--sort") for arg in mock_popen.call_args.args[0])
+        assert [(m["file"], m["line_number"]) for m in result] == [
+            ("a.txt", 7), ("b.txt", 1), ("b.txt", 3),
+        ]
+
+    def test_search_regex_does_not_use_ripgrep(self, sample_files):
+        """Regex searches always use the Python scan."""
+        with patch.object(_server, "RIPGREP_PATH", "/usr/bin/rg"):
+            with patch.object(_server, "_search_with_ripgrep") as mock_rg:
+                result = search_codebase(
+                    r"def \w+", directory=str(sample_files), is_regex=True
+                )
+
+        mock_rg.assert_not_called()
+        assert len(result) == 1
+
+    @pytest.mark.skipif(_server.re2 is None, reason="google-re2 not installed")
+    def test_search_regex_uses_re2_when_available(self, temp_dir):
+        """Regexes RE2 supports are scanned with RE2 instead of backtracking re."""
+        (temp_dir / "file.txt").write_text("aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaab\nfoo\n")
+
+        with patch.object(_server.re2, "compile", wraps=_server.re2.compile) as mock_compile:
+            result = search_codebase(r"^(a+)+$|FOO", directory=str(temp_dir), is_regex=True)
+
+        mock_compile.assert_called_once()
+        assert [m["line_number"] for m in result] == [2]
+
+    @pytest.mark.parametrize("pattern", [r"(o)\1", r"\w+o{2}", r"f(?=oo)"])
+    def test_search_regex_falls_back_to_re_for_unsupported_syntax(self, temp_dir, pattern):
+        """Backreferences, lookaround and Unicode shorthand classes still work."""
+        (temp_dir / "file.txt").write_text("bar\nfoo\n")
+
+        result = search_codebase(pattern, directory=str(temp_dir), is_regex=True)
+
+        assert [m["line_number"] for m in result] == [2]
+
+    def test_search_falls_back_when_ripgrep_fails(self, sample_files):
+        """A ripgrep failure falls back to the Python scan."""
+        with patch.object(_server, "RIPGREP_PATH", "/nonexistent/rg"):
+            result = search_codebase("hello", directory=str(sample_files))
+
+        assert [m["line_number"] for m in result] == [1]
+
+    def test_search_literal_skips_decoding_files_without_a_hit(self, temp_dir):
+        """Files whose bytes can't contain the literal are never decoded."""
+        (temp_dir / "hit.txt").write_text("needle here\n")
+        (temp_dir / "miss.txt").write_text("nothing to see\n")
+
+        read_text = Path.read_text
+        decoded = []
+
+        def tracking_read_text(self, *args, **kwargs):
+            decoded.append(self.name)
+            return read_text(self, *args, **kwargs)
+
+        with patch.object(_server, "RIPGREP_PATH", None):
+            with patch.object(Path, "read_text", tracking_read_text):
+                result = search_codebase("NEEDLE", directory=str(temp_dir))
+
+        assert [m["line_number"] for m in result] == [1]
+        assert decoded == ["hit.txt"]
+
+    @pytest.mark.parametrize(
+        ("pattern", "text", "case_insensitive"),
+        [
+            ("kelvin", "\u212aelvin scale\n", True),
+            ("SONG", "\u017fong\n", True),
+            ("CAFÉ", "café\n", True),
+            ("café", "café\n", False),
+        ],
+    )
+    def test_search_literal_byte_prefilter_keeps_unicode_matches(
+        self, temp_dir, pattern, text, case_insensitive
+    ):
+        """The byte-level prefilter never hides a match the str regex finds."""
+        (temp_dir / "file.txt").write_text(text, encoding="utf-8")
+
+        with patch.object(_server, "RIPGREP_PATH", None):
+            result = search_codebase(
+                pattern, directory=str(temp_dir), case_insensitive=case_insensitive
+            )
+
+        assert [m["line_number"] for m in result] == [1]
+
     def test_search_max_results(self, temp_dir):
         """search_codebase respects max_results limit."""
         # Create many files with matches
@@ -795,6 +1145,46 @@ class TestSearchCodebase:
         
         assert len(result) == 5
 
+    def test_search_keeps_line_order_within_files(self, temp_dir):
+        """Matches from a file come back in line order and are not interleaved."""
+        for i in range(10):
+            (temp_dir / f"file_{i}.txt").write_text("match\nskip\nmatch\n")
+
+        with patch.object(_server, "RIPGREP_PATH", None):
+            result = search_codebase("match", directory=str(temp_dir), max_results=100)
+
+        assert len(result) == 20
+        for first, second in zip(result[::2], result[1::2]):
+            assert first["file"] == second["file"]
+            assert (first["line_number"], second["line_number"]) == (1, 3)
+
+    def test_search_walk_prunes_skipped_directories(self, temp_dir):
+        """Skipped directories are not descended into and their files never listed."""
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "app.py").write_text("x\n")
+        (temp_dir / "src" / "app.pyc").write_bytes(b"x")
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "node_modules" / "pkg" / "index.js").write_text("x\n")
+        (temp_dir / ".mycelium" / "bin").mkdir(parents=True)
+        (temp_dir / ".mycelium" / "bin" / "tool").write_text("x\n")
+
+        files = sorted(
+            p.relative_to(temp_dir).as_posix()
+            for p in _server._iter_search_files(temp_dir)
+        )
+
+        assert files == ["src/app.py"]
+
+    def test_search_file_pattern_matches_basename(self, temp_dir):
+        """file_pattern globs match file names at any depth."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "a" / "b" / "deep.py").write_text("x\n")
+        (temp_dir / "a" / "notes.md").write_text("x\n")
+
+        files = [p.name for p in _server._iter_search_files(temp_dir, "*.py")]
+
+        assert files == ["deep.py"]
+
     def test_search_zero_max_results_returns_empty(self, temp_dir):
         """max_results <= 0 should return no matches."""
         (temp_dir / "file.txt").write_text("match this pattern\n")
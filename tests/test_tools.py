@@ -22,6 +22,20 @@ from mycelium.tools import (
     get_tool_names,
 )
 
+# libyaml-backed dumper (pure-Python fallback) for fixture setup, matching
+# what the orchestrator itself uses.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _schema_id(tool: dict) -> str:
+    return tool["function"]["name"]
+
+
+@pytest.fixture(scope="session")
+def schemas_by_name():
+    """Map each tool name to its schema, built once per session."""
+    return {_schema_id(t): t for t in TOOL_SCHEMAS}
+
 
 @pytest.fixture(autouse=True)
 def _sandbox_to_tmp(tmp_path):
@@ -49,23 +63,21 @@ class TestToolSchemas:
         """TOOL_SCHEMAS contains exactly 7 tools."""
         assert len(TOOL_SCHEMAS) == 7
     
-    def test_all_tools_have_required_fields(self):
-        """All tool schemas have type and function fields."""
-        for tool in TOOL_SCHEMAS:
-            assert "type" in tool
-            assert tool["type"] == "function"
-            assert "function" in tool
-            assert "name" in tool["function"]
-            assert "description" in tool["function"]
-            assert "parameters" in tool["function"]
-    
-    def test_all_parameters_have_properties(self):
-        """All tool parameters have type and properties."""
-        for tool in TOOL_SCHEMAS:
-            params = tool["function"]["parameters"]
-            assert params["type"] == "object"
-            assert "properties" in params
-            assert "required" in params
+    @pytest.mark.parametrize("tool", TOOL_SCHEMAS, ids=_schema_id)
+    def test_tool_has_required_fields(self, tool):
+        """Each tool schema has type and function fields."""
+        assert tool["type"] == "function"
+        assert "name" in tool["function"]
+        assert "description" in tool["function"]
+        assert "parameters" in tool["function"]
+    
+    @pytest.mark.parametrize("tool", TOOL_SCHEMAS, ids=_schema_id)
+    def test_tool_parameters_have_properties(self, tool):
+        """Each tool's parameters have type, properties and required."""
+        params = tool["function"]["parameters"]
+        assert params["type"] == "object"
+        assert "properties" in params
+        assert "required" in params
     
     def test_expected_tool_names(self):
         """TOOL_SCHEMAS contains all expected tools."""
@@ -100,11 +112,11 @@ class TestGetToolByName:
         tool = get_tool_by_name("nonexistent_tool")
         assert tool is None
     
-    def test_all_tools_findable(self):
-        """All tool names can be found."""
-        for name in get_tool_names():
-            tool = get_tool_by_name(name)
-            assert tool is not None
+    def test_all_tools_findable(self, schemas_by_name):
+        """All tool names resolve to their schema."""
+        assert set(get_tool_names()) == set(schemas_by_name)
+        for name, schema in schemas_by_name.items():
+            assert get_tool_by_name(name) is schema
 
 
 # =============================================================================
@@ -127,7 +139,7 @@ class TestExecuteTool:
         
         progress_file = mission_dir / "progress.yaml"
         with open(progress_file, "w") as f:
-            yaml.dump(progress_data, f)
+            yaml.dump(progress_data, f, Dumper=_YAML_DUMPER)
         
         return mission_dir
     
@@ -136,6 +148,12 @@ class TestExecuteTool:
         with pytest.raises(ValueError, match="Unknown tool"):
             execute_tool("nonexistent_tool", {})
     
+    def test_tool_map_covers_every_schema(self):
+        """Every advertised schema has an implementation in the dispatch map."""
+        from mycelium.tools import _ensure_tool_map
+
+        assert set(_ensure_tool_map()) == set(get_tool_names())
+
     def test_read_progress(self, temp_mission):
         """execute_tool dispatches read_progress correctly."""
         result = execute_tool("read_progress", {"mission_path": str(temp_mission)})
@@ -205,3 +223,47 @@ class TestFormatToolResult:
         result = format_tool_result("read_file", long_content)
         assert "truncated" in result
         assert len(result) < 15000
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_result_round_trips_with_and_without_orjson(self, use_orjson):
+        """Results decode to the same JSON whichever encoder is available."""
+        import json
+
+        import mycelium.tools as tools
+
+        if use_orjson and tools.orjson is None:
+            pytest.skip("orjson not installed")
+        result = {"files": ["é.txt"], 1: "int key", "big": 2**70, "path": Path("/tmp")}
+
+        with patch.object(tools, "orjson", tools.orjson if use_orjson else None):
+            encoded = format_tool_result("list_files", result)
+
+        assert json.loads(encoded) == {
+            "files": ["é.txt"],
+            "1": "int key",
+            "big": 2**70,
+            "path": "/tmp",
+        }
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_loads_raises_json_decode_error(self, use_orjson):
+        """Malformed tool arguments raise json.JSONDecodeError for both parsers."""
+        import json
+
+        import mycelium.tools as tools
+
+        if use_orjson and tools.orjson is None:
+            pytest.skip("orjson not installed")
+
+        with patch.object(tools, "orjson", tools.orjson if use_orjson else None):
+            assert tools.json_loads('{"path": "a"}') == {"path": "a"}
+            with pytest.raises(json.JSONDecodeError):
+                tools.json_loads("{not json")
+
+    def test_custom_max_length(self):
+        """Callers can tighten the truncation limit."""
+        import json
+
+        result = json.loads(format_tool_result("read_file", "abcdef", max_length=4))
+
+        assert result == {"content": "abcd", "truncated": True, "total_length": 6}